@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .abstract_python_file_operation import AbstractPythonFileOperation
+
+if TYPE_CHECKING:
+    from wexample_filestate.const.types_state_items import TargetFileOrDirectoryType
+
+
+class PythonRemoveUnusedOperation(AbstractPythonFileOperation):
+    """Remove unused Python imports using autoflake.
+
+    Triggered by config: { "python": ["remove_unused_imports"] }
+    """
+
+    @classmethod
+    def get_option_name(cls) -> str:
+        from wexample_filestate_python.config_option.python_config_option import (
+            PythonConfigOption,
+        )
+
+        return PythonConfigOption.OPTION_NAME_REMOVE_UNUSED
+
+    @classmethod
+    def preview_source_change(cls, target: TargetFileOrDirectoryType) -> str | None:
+        from autoflake import fix_code
+
+        src = cls._read_current_str_or_fail(target)
+
+        # Call the autoflake API in-process, like the isort operation does:
+        # forking a fresh interpreter per file costs 30-80 ms of startup
+        # before autoflake even looks at the source.
+        try:
+            modified_content = fix_code(
+                src,
+                expand_star_imports=True,
+                remove_all_unused_imports=True,
+                remove_duplicate_keys=True,
+                remove_unused_variables=True,
+            )
+        except Exception as error:
+            # Double line return is important to keep message visible event last line is erased by parent process.
+            target.io.error(f"Autoflake error: {error}\n\n")
+            return None
+
+        if not modified_content.strip():
+            return None
+
+        return modified_content
+
+    def describe_after(self) -> str:
+        return "Unused imports have been removed with autoflake."
+
+    def describe_before(self) -> str:
+        return "The Python file contains unused imports."
+
+    def description(self) -> str:
+        return "Remove unused imports from the Python file using autoflake."
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
+
+if TYPE_CHECKING:
+    from libcst import CSTNode
+
+# libcst's default on_visit/on_leave build an f-string and do a getattr for
+# every node in the tree. The handler set is fixed per visitor class, so each
+# subclass of these mixins carries its own type -> function map (created in
+# __init_subclass__ so sibling visitors never see each other's entries). A
+# None entry short-circuits the common case — most node classes on a CST have
+# no handler at all. List the mixin before the libcst base so its overrides
+# win in the MRO.
+
+
+class CachedTransformerDispatchMixin:
+    """Cache visit_*/leave_* handler lookups per node class for transformers."""
+
+    _leave_dispatch: ClassVar[dict[type, Callable[..., Any] | None]]
+    _visit_dispatch: ClassVar[dict[type, Callable[..., Any] | None]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._visit_dispatch = {}
+        cls._leave_dispatch = {}
+
+    def on_visit(self, node: CSTNode) -> bool:
+        t = type(node)
+        cache = self._visit_dispatch
+        try:
+            visit_func = cache[t]
+        except KeyError:
+            visit_func = cache[t] = getattr(type(self), f"visit_{t.__name__}", None)
+        if visit_func is None:
+            return True
+        return visit_func(self, node) is not False
+
+    def on_leave(self, original_node: Any, updated_node: Any) -> Any:
+        t = type(original_node)
+        cache = self._leave_dispatch
+        try:
+            leave_func = cache[t]
+        except KeyError:
+            leave_func = cache[t] = getattr(type(self), f"leave_{t.__name__}", None)
+        if leave_func is not None:
+            updated_node = leave_func(self, original_node, updated_node)
+        return updated_node
+
+
+class CachedVisitorDispatchMixin:
+    """Cache visit_*/leave_* handler lookups per node class for visitors."""
+
+    _leave_dispatch: ClassVar[dict[type, Callable[..., Any] | None]]
+    _visit_dispatch: ClassVar[dict[type, Callable[..., Any] | None]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._visit_dispatch = {}
+        cls._leave_dispatch = {}
+
+    def on_visit(self, node: CSTNode) -> bool:
+        t = type(node)
+        cache = self._visit_dispatch
+        try:
+            visit_func = cache[t]
+        except KeyError:
+            visit_func = cache[t] = getattr(type(self), f"visit_{t.__name__}", None)
+        if visit_func is None:
+            return True
+        return visit_func(self, node) is not False
+
+    def on_leave(self, original_node: CSTNode) -> None:
+        t = type(original_node)
+        cache = self._leave_dispatch
+        try:
+            leave_func = cache[t]
+        except KeyError:
+            leave_func = cache[t] = getattr(type(self), f"leave_{t.__name__}", None)
+        if leave_func is not None:
+            leave_func(self, original_node)
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import ast
+import tokenize
+from io import StringIO
+
+from wexample_filestate_python.operation.utils.python_constants_utils import (
+    _FLAG_RE,
+    _lkey,
+    FLAG_NAME,
+    reorder_flagged_constants_everywhere,
+)
+
+# A plan entry is (start_line, end_line, new_lines): the 1-based inclusive
+# source range of a flagged block (leading trivia included) and the absolute
+# line numbers to emit there instead, in order.
+_Plan = list[tuple[int, int, list[int]]]
+
+
+def fast_sort_flagged_constants(src: str) -> str:
+    """Sort flagged constant blocks by rewriting source lines directly.
+
+    The constant-sort transform only needs to find UPPER_CASE assignments
+    under a flag comment and permute whole statement lines, which stdlib
+    ast + tokenize cover at a fraction of a libcst parse. Blocks with any
+    non-trivial trivia (multiline assignments, comments inside the block,
+    statements sharing a line, a flag the planner cannot place) fall back
+    to the libcst path, which stays the reference implementation.
+    """
+    if FLAG_NAME not in src:
+        return src
+
+    plan = _plan_text_sort(src)
+    if plan is None:
+        # Non-trivial layout: defer to the CST implementation.
+        import libcst as cst
+
+        return reorder_flagged_constants_everywhere(cst.parse_module(src), src).code
+    if not plan:
+        return src
+
+    lines = src.splitlines(keepends=True)
+    # Regions never overlap, so applying back-to-front keeps indices valid.
+    for start, end, new_lines in reversed(plan):
+        lines[start - 1 : end] = [lines[number - 1] for number in new_lines]
+    return "".join(lines)
+
+
+def _constant_name(stmt: ast.stmt) -> str | None:
+    if type(stmt) is ast.Assign:
+        targets = stmt.targets
+        if len(targets) != 1:
+            return None
+        target = targets[0]
+    elif type(stmt) is ast.AnnAssign:
+        target = stmt.target
+    else:
+        return None
+    if type(target) is not ast.Name:
+        return None
+    value = target.id
+    return value if value.isupper() else None
+
+
+def _flag_comment_lines(src: str, src_lines: list[str]) -> set[int] | None:
+    """Line numbers of own-line flag comments, or None if tokenizing fails."""
+    flag_lines: set[int] = set()
+    try:
+        for tok in tokenize.generate_tokens(StringIO(src).readline):
+            if tok.type != tokenize.COMMENT or not _FLAG_RE.search(tok.string):
+                continue
+            row, col = tok.start
+            # Only own-line comments count, matching leading_lines semantics.
+            if src_lines[row - 1][:col].strip():
+                return None
+            flag_lines.add(row)
+    except (tokenize.TokenError, IndentationError):
+        return None
+    return flag_lines
+
+
+def _plan_body(
+    body: list[ast.stmt],
+    boundary: int | None,
+    flag_lines: set[int],
+    src_lines: list[str],
+    plans: _Plan,
+    consumed: set[int],
+) -> bool:
+    """Plan the sorts for one statement list; False means fall back.
+
+    boundary is the header line of the enclosing class, or None at module
+    level, where trivia before the first statement belongs to the module
+    header rather than to any statement's leading lines.
+    """
+    i = 0
+    n = len(body)
+    while i < n:
+        stmt = body[i]
+        # Leading trivia region, mirroring libcst leading_lines attachment.
+        if i > 0:
+            lead_start = body[i - 1].end_lineno + 1
+        elif boundary is not None:
+            lead_start = boundary + 1
+        else:
+            lead_start = stmt.lineno
+        block_flags = [k for k in range(lead_start, stmt.lineno) if k in flag_lines]
+        if not block_flags:
+            i += 1
+            continue
+
+        name = _constant_name(stmt)
+        if name is None:
+            # A flag above a non-constant starts no block in the CST path
+            # either; it just never triggers.
+            consumed.update(block_flags)
+            i += 1
+            continue
+
+        # Split the leading lines the way sort_constants_block does: flag
+        # lines migrate to the block's new first statement, everything else
+        # (blanks, plain comments) stays with the original first statement.
+        flag0: list[int] = []
+        cleaned0: list[int] = []
+        for k in range(lead_start, stmt.lineno):
+            if k in flag_lines:
+                flag0.append(k)
+                continue
+            stripped = src_lines[k - 1].strip()
+            if stripped and not stripped.startswith("#"):
+                # Code where only trivia is expected (multiline class
+                # headers and the like): let libcst sort it out.
+                return False
+            cleaned0.append(k)
+        consumed.update(block_flags)
+
+        block: list[tuple[str, ast.stmt]] = [(name, stmt)]
+        j = i + 1
+        while j < n:
+            nxt = body[j]
+            prev_end = body[j - 1].end_lineno
+            if nxt.lineno <= prev_end:
+                # Statements sharing a line (semicolons) don't map to
+                # whole-line permutations.
+                return False
+            if nxt.lineno > prev_end + 1:
+                # Gap: blank lines end the block; comment lines would have
+                # to travel with their statement, which line slicing can't
+                # express — fall back in that case.
+                if any(src_lines[k].strip() for k in range(prev_end, nxt.lineno - 1)):
+                    return False
+                break
+            nm = _constant_name(nxt)
+            if nm is None:
+                break
+            block.append((nm, nxt))
+            j += 1
+
+        for _, s in block:
+            if s.lineno != s.end_lineno:
+                return False
+
+        if len(block) > 1:
+            keys = [_lkey(nm) for nm, _ in block]
+            order = sorted(range(len(block)), key=lambda k: (keys[k], k))
+            if order != list(range(len(block))):
+                new_lines = list(flag0)
+                for k in order:
+                    if k == 0:
+                        new_lines.extend(cleaned0)
+                    new_lines.append(block[k][1].lineno)
+                plans.append((lead_start, block[-1][1].end_lineno, new_lines))
+        i = j
+    return True
+
+
+def _plan_text_sort(src: str) -> _Plan | None:
+    """Compute the line-permutation plan, or None when libcst must handle it."""
+    src_lines = src.splitlines()
+    flag_lines = _flag_comment_lines(src, src_lines)
+    if flag_lines is None:
+        return None
+    if not flag_lines:
+        return []
+
+    try:
+        tree = ast.parse(src)
+    except SyntaxError:
+        return None
+
+    plans: _Plan = []
+    consumed: set[int] = set()
+    if not _plan_body(tree.body, None, flag_lines, src_lines, plans, consumed):
+        return None
+    for node in tree.body:
+        if type(node) is ast.ClassDef:
+            if not _plan_body(
+                node.body, node.lineno, flag_lines, src_lines, plans, consumed
+            ):
+                return None
+
+    # A flag the planner could not attribute to a statement (module header,
+    # nested scopes, ...) may still mean work for libcst.
+    if flag_lines - consumed:
+        return None
+    return plans
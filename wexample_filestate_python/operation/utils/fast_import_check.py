@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import ast
+
+
+def needs_import_relocation(src: str) -> bool:
+    """Fast raw-source check for whether import relocation could change src.
+
+    Every rewrite the relocate pipeline can make — pruning module-level
+    imports, adding a TYPE_CHECKING block, injecting function-local imports —
+    starts from an imported name, so a file without a single import statement
+    is provably a no-op and never needs the libcst parse. Stdlib ast settles
+    that far cheaper. Biased toward returning True: libcst remains the one
+    that decides and rewrites; this may only skip files it can prove are
+    no-ops.
+    """
+    try:
+        tree = ast.parse(src)
+    except SyntaxError:
+        return True
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            return True
+    return False
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import atexit
+import json
+import os
+
+# On-disk memo for operation previews: as long as a file's mtime and size are
+# unchanged, re-running the same operation on it would produce the same
+# preview, so the expensive parse/format work can be skipped entirely.
+_CACHE_DIR = os.path.expanduser("~/.cache/wexample_filestate_python")
+_CACHE_INDEX_PATH = os.path.join(_CACHE_DIR, "preview_cache.json")
+
+# Sentinel stored when an operation previews "nothing to change" — the common
+# case on repeated runs, and the one the cache exists for. No real preview is
+# ever this string (previews are valid Python source).
+NO_CHANGE = "\x00no-change\x00"
+
+# Oldest entries are dropped once the index grows past this size; trimming is
+# amortized instead of running on every store.
+_MAX_ENTRIES = 2048
+_TRIM_EVERY = 64
+
+_index: dict[str, list] | None = None
+_stores_since_trim = 0
+_dirty = False
+
+
+def get_cached_preview(op_name: str, path: str) -> str | None:
+    """Return the cached preview output for path, or None on miss.
+
+    The entry is only valid while the file's (st_mtime_ns, st_size) signature
+    matches the one recorded at store time — with one recovery: when the
+    operation has just applied its own preview, the file now holds exactly
+    the stored output, so one file read (far cheaper than the parse the
+    cache avoids) re-stamps the entry as NO_CHANGE under the new signature.
+    """
+    signature = _file_signature(path)
+    if signature is None:
+        return None
+
+    entry = _load_index().get(_entry_key(op_name, path))
+    if entry is None:
+        return None
+
+    mtime_ns, size, output = entry
+    if (mtime_ns, size) != signature:
+        if output != NO_CHANGE and _matches_file(path, output):
+            set_cached_preview(op_name, path, NO_CHANGE)
+            return NO_CHANGE
+        return None
+
+    return output
+
+
+def set_cached_preview(op_name: str, path: str, output: str) -> None:
+    """Record the preview output for path under its current file signature.
+
+    `output` may be NO_CHANGE to record that the operation would not touch
+    the file. The on-disk index is written at most once per _TRIM_EVERY
+    stores (and once at interpreter exit) instead of on every store.
+    """
+    global _dirty, _stores_since_trim
+
+    signature = _file_signature(path)
+    if signature is None:
+        return
+
+    index = _load_index()
+    key = _entry_key(op_name, path)
+    # Re-inserting moves the key to the end, which keeps the trim LRU-ish.
+    index.pop(key, None)
+    index[key] = [signature[0], signature[1], output]
+    _dirty = True
+
+    _stores_since_trim += 1
+    if _stores_since_trim >= _TRIM_EVERY:
+        _stores_since_trim = 0
+        while len(index) > _MAX_ENTRIES:
+            index.pop(next(iter(index)))
+        _flush()
+
+
+def _entry_key(op_name: str, path: str) -> str:
+    return f"{op_name}::{path}"
+
+
+def _file_signature(path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _matches_file(path: str, output: str) -> bool:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read() == output
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+def _flush() -> None:
+    global _dirty
+    if _dirty and _index is not None:
+        _save_index(_index)
+        _dirty = False
+
+
+def _load_index() -> dict[str, list]:
+    global _index
+    if _index is None:
+        try:
+            with open(_CACHE_INDEX_PATH, encoding="utf-8") as f:
+                _index = json.load(f)
+        except (OSError, ValueError):
+            _index = {}
+    return _index
+
+
+def _save_index(index: dict[str, list]) -> None:
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(_CACHE_INDEX_PATH, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+    except OSError:
+        # The cache is best-effort; never fail the operation for it.
+        pass
+
+
+# Stores between trim points stay memory-only; this catches the tail.
+atexit.register(_flush)
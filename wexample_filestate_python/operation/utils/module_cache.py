@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sqlite3
+
+import libcst as cst
+
+# Persistent parse cache: libcst parsing dominates the cost of every CST
+# operation, and most files are unchanged between runs. Modules are immutable
+# and picklable, so a pickled tree keyed by the source digest can stand in
+# for a re-parse. Lives next to the preview cache.
+_CACHE_DIR = os.path.expanduser("~/.cache/wexample_filestate_python")
+_CACHE_DB_PATH = os.path.join(_CACHE_DIR, "parse_cache.sqlite")
+
+_connection: sqlite3.Connection | None = None
+
+# Hit/miss counters, mostly for profiling runs; reset is just reassigning.
+cache_stats = {"hits": 0, "misses": 0, "transform_hits": 0, "transform_misses": 0}
+
+
+def get_cached_transform(src: str, transform_name: str) -> str | None:
+    """Return the cached output of a named source transform, or None.
+
+    Caching the before->after text lets repeated runs over untouched files
+    skip libcst entirely — not just the parse, but the traversal and code
+    generation too.
+    """
+    connection = _connect()
+    if connection is None:
+        return None
+    try:
+        row = connection.execute(
+            "SELECT result FROM transform_cache WHERE key = ?",
+            (_transform_key(src, transform_name),),
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        cache_stats["transform_misses"] += 1
+        return None
+    cache_stats["transform_hits"] += 1
+    return row[0]
+
+
+def load_module_cached(path: str, src: str) -> cst.Module:
+    """Parse src into a cst.Module, reusing the pickled tree from a prior run.
+
+    The cache is keyed by path and invalidated by a digest of the source and
+    the installed libcst version (pickles do not survive version bumps), so
+    edits (and reverts) always resolve correctly. Best-effort: any cache
+    failure falls back to a plain parse.
+    """
+    sha = _source_digest(src)
+
+    connection = _connect()
+    if connection is not None:
+        try:
+            row = connection.execute(
+                "SELECT sha, pickle FROM parse_cache WHERE path = ?", (path,)
+            ).fetchone()
+            if row is not None and row[0] == sha:
+                module = pickle.loads(row[1])
+                cache_stats["hits"] += 1
+                return module
+        except (sqlite3.Error, pickle.PickleError, AttributeError, EOFError):
+            pass
+
+    cache_stats["misses"] += 1
+    module = cst.parse_module(src)
+
+    if connection is not None:
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO parse_cache (path, sha, pickle) VALUES (?, ?, ?)",
+                (path, sha, pickle.dumps(module)),
+            )
+            connection.commit()
+        except (sqlite3.Error, pickle.PickleError):
+            pass
+
+    return module
+
+
+def store_cached_transform(src: str, transform_name: str, result: str) -> None:
+    """Record the output of a named source transform for future runs."""
+    connection = _connect()
+    if connection is None:
+        return
+    try:
+        connection.execute(
+            "INSERT OR REPLACE INTO transform_cache (key, result) VALUES (?, ?)",
+            (_transform_key(src, transform_name), result),
+        )
+        connection.commit()
+    except sqlite3.Error:
+        pass
+
+
+def _connect() -> sqlite3.Connection | None:
+    global _connection
+    if _connection is None:
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            _connection = sqlite3.connect(_CACHE_DB_PATH)
+            _connection.execute(
+                "CREATE TABLE IF NOT EXISTS parse_cache"
+                " (path TEXT PRIMARY KEY, sha BLOB, pickle BLOB)"
+            )
+            _connection.execute(
+                "CREATE TABLE IF NOT EXISTS transform_cache"
+                " (key BLOB PRIMARY KEY, result TEXT)"
+            )
+        except sqlite3.Error:
+            # The cache is best-effort; never fail the operation for it.
+            _connection = None
+    return _connection
+
+
+def _libcst_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("libcst")
+    except Exception:
+        return "unknown"
+
+
+def _source_digest(src: str) -> bytes:
+    digest = hashlib.sha256(_libcst_version().encode())
+    digest.update(b"\x00")
+    digest.update(src.encode())
+    return digest.digest()
+
+
+def _transform_key(src: str, transform_name: str) -> bytes:
+    digest = hashlib.sha256(transform_name.encode())
+    digest.update(b"\x00")
+    digest.update(_source_digest(src))
+    return digest.digest()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from itertools import repeat
+from pathlib import Path
+
+# Below this many files the fork/pickle overhead of a process pool outweighs
+# the parallel speedup.
+_PARALLEL_THRESHOLD = 4
+
+
+def process_files_batch(
+    paths: Iterable[str | Path],
+    transform_fn: Callable[[str], str] | None = None,
+    *,
+    parallel: bool | None = None,
+) -> list[str]:
+    """Apply a source transform to many files, fanning out across CPU cores.
+
+    The per-file transforms are pure, CPU-bound CST rewrites with no shared
+    state, so batches fan out over a ProcessPoolExecutor (processes, not
+    threads: libcst parsing holds the GIL). Each worker writes a file back
+    only when the transformed source differs from the input.
+
+    Args:
+        paths: Files to process.
+        transform_fn: Source-to-source callable; must be picklable
+            (module-level). Defaults to the structural transforms
+            (docstring/classes/constants ordering).
+        parallel: Force the pool on or off; by default it is enabled from
+            four files upward.
+
+    Returns:
+        The paths whose content changed.
+    """
+    path_list = [str(p) for p in paths]
+    if transform_fn is None:
+        transform_fn = apply_structural_transforms
+    if parallel is None:
+        parallel = len(path_list) >= _PARALLEL_THRESHOLD
+
+    if not parallel:
+        results = (_process_one(p, transform_fn) for p in path_list)
+        return [p for p, changed in zip(path_list, results) if changed]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(_process_one, path_list, repeat(transform_fn)))
+    return [p for p, changed in zip(path_list, results) if changed]
+
+
+def apply_structural_transforms(src: str) -> str:
+    """Default batch transform: docstring, class and constant ordering."""
+    import libcst as cst
+
+    from wexample_filestate_python.operation.utils.python_classes_utils import (
+        reorder_module_classes,
+    )
+    from wexample_filestate_python.operation.utils.python_constants_utils import (
+        reorder_flagged_constants_everywhere,
+    )
+    from wexample_filestate_python.operation.utils.python_docstring_utils import (
+        move_docstring_to_top,
+    )
+
+    module = cst.parse_module(src)
+    module = move_docstring_to_top(module)
+    module = reorder_module_classes(module)
+    module = reorder_flagged_constants_everywhere(module, src)
+    return module.code
+
+
+def _process_one(path: str, transform_fn: Callable[[str], str]) -> bool:
+    """Transform one file in place; returns whether its content changed."""
+    file = Path(path)
+    src = file.read_text()
+    new_src = transform_fn(src)
+    if new_src == src:
+        return False
+    file.write_text(new_src)
+    return True
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import sys
+
+import libcst as cst
+
+# Special attribute names and inner classes to prioritize. Frozen and
+# interned: identifier values coming out of the parser are interned too, so
+# the per-node membership test in _is_special_attribute usually resolves on
+# pointer equality.
+SPECIAL_ATTR_NAMES = frozenset(
+    {sys.intern("__slots__"), sys.intern("__match_args__")}
+)
+SPECIAL_INNER_CLASS_NAMES = frozenset({sys.intern("Config")})
+
+
+def ensure_order_class_attributes_in_module(module: cst.Module) -> cst.Module:
+    # Copy the body lazily: most modules need no rewriting, and the copy is
+    # only useful once a class actually changes.
+    new_body: list[cst.CSTNode] | None = None
+    for idx, node in enumerate(module.body):
+        if type(node) is cst.ClassDef:
+            updated = reorder_class_attributes(node)
+            if updated is not node:
+                if new_body is None:
+                    new_body = list(module.body)
+                new_body[idx] = updated
+    if new_body is None:
+        return module
+    return module.with_changes(body=new_body)
+
+
+def find_attribute_blocks_in_class(
+    classdef: cst.ClassDef,
+) -> list[tuple[int, int, list[cst.CSTNode]]]:
+    """Find contiguous blocks of class attributes within the class body.
+
+    A block starts at an attribute statement and continues through subsequent
+    attribute statements; it stops when hitting a blank separator (empty line without
+    comment) or a non-attribute node (e.g., def, @decorated def, etc.).
+    Inline and preceding comment lines are considered attached to the following node.
+
+    Returns list of (start_index, end_index_exclusive, nodes)
+    where indices refer to classdef.body.body positions.
+    """
+    # The body tuple is read-only here and already indexable; most classes
+    # hold no reorderable attribute at all, so bail out before any per-class
+    # allocation.
+    body_list = classdef.body.body
+    if not any(_is_attribute_statement(node) for node in body_list):
+        return []
+
+    n = len(body_list)
+    blocks: list[tuple[int, int, list[cst.CSTNode]]] = []
+    i = 0
+    while i < n:
+        node = body_list[i]
+        if _is_attribute_statement(node):
+            # Start a block
+            j = i
+            nodes: list[cst.CSTNode] = []
+            while j < n:
+                cur = body_list[j]
+                if _is_attribute_statement(cur):
+                    # If not the first, ensure there is no blank separator before cur
+                    if j != i:
+                        # Stop if there is a blank separator among leading_lines (for simple statements)
+                        if isinstance(cur, cst.SimpleStatementLine):
+                            if any(el.comment is None for el in cur.leading_lines):
+                                break
+                        # For ClassDef, presence of a preceding blank line is represented
+                        # by a separate EmptyLine node; if previous sibling is a blank separator, stop.
+                        prev = body_list[j - 1]
+                        if _is_blank_separator(prev):
+                            break
+                    nodes.append(cur)
+                    j += 1
+                    continue
+                # Stop on first non-attribute node
+                break
+            if nodes:
+                blocks.append((i, j, nodes))
+                i = j
+                continue
+        i += 1
+    return blocks
+
+
+def reorder_attribute_block(
+    nodes: list[cst.CSTNode], *, dataclass_mode: bool = False
+) -> list[cst.CSTNode]:
+    """Reorder one attribute block by categories, preserving per-node leading comments.
+
+    Order:
+      1) Special (__slots__, __match_args__, inner class Config)
+      2) Public A–Z
+      3) Private/protected A–Z
+    """
+
+    # _attr_name walks node.body[0].targets[0].target each time; cache it per
+    # node (by identity, which skips CST __hash__ cost) so the key function
+    # and the special-attribute check share one walk instead of two.
+    name_cache: dict[int, str] = {}
+
+    def name_of(node: cst.CSTNode) -> str:
+        key = id(node)
+        name = name_cache.get(key)
+        if name is None:
+            name = _attr_name(node) or ""
+            name_cache[key] = name
+        return name
+
+    def cat(node: cst.CSTNode) -> tuple:
+        name = name_of(node)
+        if _is_special_attribute(node, name=name):
+            # Category 0: special always first
+            return (0, _sort_key(name), False)
+        if dataclass_mode:
+            # In dataclass mode, prioritize fields without defaults (required),
+            # then fields with defaults/default_factory; non-field attributes come after.
+            if _is_dataclass_field(node):
+                if _dataclass_field_has_default(node):
+                    # Category 2: defaulted fields
+                    return (2, _sort_key(name), False)
+                # Category 1: required fields
+                return (1, _sort_key(name), False)
+            # Non-field attributes: keep public before private after fields
+            if _is_public(name):
+                return (3, _sort_key(name), False)
+            return (4, _sort_key(name), False)
+        # Default (non-dataclass) ordering: public, then private
+        if _is_public(name):
+            # Category 1
+            return (1, _sort_key(name), False)
+        # Category 2 (private/protected)
+        return (2, _sort_key(name), False)
+
+    keys = [cat(node) for node in nodes]
+
+    # Blocks already in order are the common case after a first formatting
+    # run: a single monotonicity scan avoids the O(n log n) sort and its
+    # allocations entirely, and an unchanged block comes back as-is (no diff).
+    for i in range(1, len(keys)):
+        if keys[i] < keys[i - 1]:
+            break
+    else:
+        return nodes
+
+    # Preserve each node's own leading_lines; we don't need to move comments across nodes
+    # because comments directly above an attribute are attached to that attribute's leading_lines.
+    return [node for _, node in sorted(zip(keys, nodes), key=lambda kv: kv[0])]
+
+
+def reorder_class_attributes(classdef: cst.ClassDef) -> cst.ClassDef:
+    blocks = find_attribute_blocks_in_class(classdef)
+    if not blocks:
+        return classdef
+
+    body = classdef.body.body
+    dc_mode = _is_dataclass(classdef)
+
+    # Build the new body in a single pass: splicing each block into a copied
+    # list costs O(len(body)) per slice assignment, O(k*N) overall for k
+    # blocks, while one copy-runs-and-reordered-blocks pass stays O(N).
+    out: list[cst.CSTNode] = []
+    cursor = 0
+    changed = False
+    for start, end, nodes in blocks:
+        out.extend(body[cursor:start])
+        new_nodes = reorder_attribute_block(nodes, dataclass_mode=dc_mode)
+        # reorder_attribute_block returns the input list itself when the
+        # block is already ordered, so identity is a reliable change signal
+        # and avoids libcst's deep structural __eq__ over every node.
+        if new_nodes is not nodes:
+            changed = True
+        out.extend(new_nodes)
+        cursor = end
+
+    if not changed:
+        return classdef
+
+    out.extend(body[cursor:])
+    return classdef.with_changes(body=classdef.body.with_changes(body=out))
+
+
+def _attr_name(node: cst.CSTNode) -> str | None:
+    if isinstance(node, cst.SimpleStatementLine) and len(node.body) == 1:
+        small = node.body[0]
+        if isinstance(small, cst.Assign):
+            tgt = small.targets[0].target
+            if isinstance(tgt, cst.Name):
+                return tgt.value
+        if isinstance(small, cst.AnnAssign):
+            tgt = small.target
+            if isinstance(tgt, cst.Name):
+                return tgt.value
+    if isinstance(node, cst.ClassDef):
+        return node.name.value
+    return None
+
+
+def _dataclass_field_has_default(node: cst.CSTNode) -> bool:
+    """Return True if the dataclass field has a default value or default_factory.
+
+    We treat any AnnAssign with a non-None value as having a default.
+    This includes calls like field(default=..., default_factory=...).
+    """
+    if not _is_dataclass_field(node):
+        return False
+    assert isinstance(node, cst.SimpleStatementLine)
+    small = node.body[0]
+    assert isinstance(small, cst.AnnAssign)
+    return small.value is not None
+
+
+def _is_attribute_statement(node: cst.CSTNode) -> bool:
+    """Return True if node is a class-level attribute we should order.
+
+    We consider:
+      - Simple single-target Name assignments (Assign/AnnAssign) whose target name is NOT UPPER_CASE
+      - Inner class definitions (e.g., Config) as attributes for ordering
+
+    Uppercase names are ignored here (treated as constants in another operation).
+    """
+    if isinstance(node, cst.SimpleStatementLine) and len(node.body) == 1:
+        small = node.body[0]
+        if isinstance(small, cst.Assign):
+            # Only simple single-target Name assignments
+            if len(small.targets) != 1:
+                return False
+            target = small.targets[0].target
+            if isinstance(target, cst.Name):
+                # Ignore UPPER_CASE constants
+                if target.value.isupper():
+                    return False
+                return True
+            return False
+        if isinstance(small, cst.AnnAssign):
+            target = small.target
+            if isinstance(target, cst.Name):
+                if target.value.isupper():
+                    return False
+                return True
+            return False
+    # Pydantic / config style inner classes are considered attributes for ordering
+    if isinstance(node, cst.ClassDef) and isinstance(node.name, cst.Name):
+        return True
+    return False
+
+
+def _is_blank_separator(node: cst.CSTNode) -> bool:
+    # A blank separator is an EmptyLine without a comment
+    return isinstance(node, cst.EmptyLine) and node.comment is None
+
+
+def _is_comment_line(node: cst.CSTNode) -> bool:
+    return isinstance(node, cst.EmptyLine) and node.comment is not None
+
+
+def _is_dataclass(classdef: cst.ClassDef) -> bool:
+    """Detect if class has a @dataclass decorator (dataclass or dataclasses.dataclass)."""
+    for dec in classdef.decorators:
+        try:
+            expr = dec.decorator
+            if isinstance(expr, cst.Name) and expr.value == "dataclass":
+                return True
+            if isinstance(expr, cst.Attribute) and isinstance(expr.attr, cst.Name):
+                if expr.attr.value == "dataclass":
+                    return True
+        except Exception:
+            continue
+    return False
+
+
+def _is_dataclass_field(node: cst.CSTNode) -> bool:
+    """Dataclass fields are typically annotated assignments (AnnAssign) with non-UPPER names."""
+    if isinstance(node, cst.SimpleStatementLine) and len(node.body) == 1:
+        small = node.body[0]
+        if isinstance(small, cst.AnnAssign):
+            tgt = small.target
+            if isinstance(tgt, cst.Name) and not tgt.value.isupper():
+                return True
+    return False
+
+
+def _is_public(name: str) -> bool:
+    return not name.startswith("_")
+
+
+def _is_special_attribute(node: cst.CSTNode, name: str | None = None) -> bool:
+    if name is None:
+        name = _attr_name(node)
+    if not name:
+        return False
+    if name in SPECIAL_ATTR_NAMES:
+        return True
+    if isinstance(node, cst.ClassDef) and name in SPECIAL_INNER_CLASS_NAMES:
+        return True
+    return False
+
+
+def _sort_key(name: str) -> tuple:
+    # Case-insensitive A-Z; ensure '_' sorts after letters
+    # We achieve this by key: (name without leading '_', is_private)
+    return (name.lstrip("_").lower(), name.startswith("_"))
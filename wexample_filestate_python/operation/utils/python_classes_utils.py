@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import libcst as cst
+
+from wexample_filestate_python.operation.utils.python_constants_utils import _lkey
+
+
+def collect_module_classes(module: cst.Module) -> list[tuple[int, cst.ClassDef]]:
+    """Collect top-level class definitions with their positions in module.body."""
+    classes: list[tuple[int, cst.ClassDef]] = []
+    for idx, node in enumerate(module.body):
+        if isinstance(node, cst.ClassDef):
+            classes.append((idx, node))
+    return classes
+
+
+def reorder_module_classes(module: cst.Module) -> cst.Module:
+    """Reorder module-level classes alphabetically (case-insensitive).
+
+    The class block stays anchored at the position of the first class, and each
+    class keeps its own leading_lines so attached comments travel with it.
+    """
+    classes_with_idx = collect_module_classes(module)
+    if len(classes_with_idx) < 2:
+        return module
+
+    classes = [c for _, c in classes_with_idx]
+
+    # Compute the lowercase keys once up front instead of through a key
+    # lambda: the keys double as an already-sorted check, and most modules
+    # pass it after a first formatting run, so no body rewriting happens.
+    # _lkey interns the keys so repeated runs reuse the same strings.
+    keys = [_lkey(c.name.value) for c in classes]
+    for i in range(1, len(keys)):
+        if keys[i] < keys[i - 1]:
+            break
+    else:
+        return module
+
+    # Decorate-sort-undecorate; the original index keeps the sort stable
+    # without ever comparing CST nodes.
+    keyed = [(key, i, c) for i, (key, c) in enumerate(zip(keys, classes))]
+    keyed.sort()
+    sorted_classes = [kv[2] for kv in keyed]
+
+    # Remove all class nodes from the body; a set keeps the membership test
+    # below O(1) instead of scanning a list once per body element.
+    remove_indices = {idx for idx, _ in classes_with_idx}
+
+    new_body: list[cst.CSTNode] = []
+    for idx, node in enumerate(module.body):
+        if idx in remove_indices:
+            continue
+        new_body.append(node)
+
+    # Anchor = index of the first class in the original body; reinsert the
+    # whole sorted block there (adjusted for removals) so unrelated code such
+    # as type aliases or module constants keeps its place.
+    first_class_index = classes_with_idx[0][0]
+    removed_before_anchor = sum(1 for i in remove_indices if i < first_class_index)
+    insert_at = first_class_index - removed_before_anchor
+
+    # Keep __main__ guard last: if we somehow would insert after it, clamp to its position
+    for idx, node in enumerate(new_body):
+        if _is_main_guard(node) and insert_at > idx:
+            insert_at = idx
+            break
+
+    # Insert classes as a contiguous block
+    new_body[insert_at:insert_at] = sorted_classes
+
+    return module.with_changes(body=new_body)
+
+
+def _is_main_guard(node: cst.CSTNode) -> bool:
+    # Match patterns like: if __name__ == "__main__":
+    # Called once per remaining body node; exact-type checks bail on the
+    # first mismatch without walking each node's MRO the way isinstance does.
+    if type(node) is not cst.If:
+        return False
+    test = node.test
+    if type(test) is not cst.Comparison:
+        return False
+    left = test.left
+    comparisons = test.comparisons
+    if len(comparisons) != 1 or type(left) is not cst.Name or left.value != "__name__":
+        return False
+    comparison = comparisons[0]
+    comparator = comparison.comparator
+    return (
+        type(comparison.operator) is cst.Equal
+        and type(comparator) is cst.SimpleString
+        # SimpleString.value keeps the source quotes, so compare against the
+        # two literal spellings directly instead of unquoting.
+        and comparator.value in ('"__main__"', "'__main__'")
+    )
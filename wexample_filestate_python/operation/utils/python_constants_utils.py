@@ -0,0 +1,379 @@
+from __future__ import annotations
+
+import re
+import sys
+from collections.abc import Sequence
+from typing import NamedTuple
+
+import libcst as cst
+
+FLAG_NAME = "python-constant-sort"
+
+# Compiled once at import: same per-line marker semantics as
+# wexample_filestate.helpers.flag.flag_exists, without rebuilding the
+# pattern (and taking the re cache lookup) on every comment.
+_FLAG_RE = re.compile(
+    rf"^[\t ]*#\s*filestate:\s*{re.escape(FLAG_NAME)}\b", flags=re.MULTILINE
+)
+
+# Memos keyed on node identity: nodes are immutable and the block finders
+# and sorter test the same statements repeatedly. Cleared by the public
+# entry points so ids are never reused across modules.
+_flag_cache: dict[int, bool] = {}
+_name_cache: dict[int, str | None] = {}
+
+# Interned lowercase sort keys: the same short constant and class names
+# recur across a codebase, and str.lower() allocates a fresh string every
+# call. This cache survives across modules on purpose, bounded below.
+_lower_cache: dict[str, str] = {}
+
+
+def _lkey(s: str) -> str:
+    v = _lower_cache.get(s)
+    if v is None:
+        if len(_lower_cache) > 4096:
+            _lower_cache.clear()
+        v = sys.intern(s.lower())
+        _lower_cache[s] = v
+    return v
+
+
+class Block(NamedTuple):
+    """A flagged constant block located in a statement list.
+
+    start/end are body indices (end exclusive); nodes is the block's
+    statements as a tuple — it is never mutated after construction, and
+    named C-level attribute access beats tuple unpacking at the consumers.
+    """
+
+    start: int
+    end: int
+    nodes: tuple[cst.SimpleStatementLine, ...]
+
+
+def find_flagged_constant_blocks(module: cst.Module, src: str) -> list[Block]:
+    """Find blocks of contiguous UPPER_CASE assignments following the filestate flag.
+
+    A block starts at the first assignment statement that has the flag in its leading
+    comments; it continues with subsequent contiguous constant assignments until a
+    blank line or a non-constant statement is found.
+
+    Returns Block records whose indices refer to module.body positions.
+    """
+    blocks: list[Block] = []
+
+    i = 0
+    body = module.body
+    n = len(body)
+    # Exact-type checks: these libcst classes are concrete leaves, so the
+    # isinstance MRO walk buys nothing in this per-node loop. The body tuple
+    # is also indexed directly instead of being copied per candidate.
+    while i < n:
+        stmt = body[i]
+        if type(stmt) is cst.SimpleStatementLine:
+            has_flag = _stmt_has_flag(stmt, src) or _prev_line_has_flag(body, i)
+            if has_flag and _get_simple_assignment_name(stmt) is not None:
+                # Start a block at i
+                j = i
+                nodes: list[cst.SimpleStatementLine] = []
+                while j < n:
+                    s = body[j]
+                    if type(s) is cst.SimpleStatementLine:
+                        if j != i:
+                            # Stop the block ONLY if there is a blank line separation
+                            # (an EmptyLine without a comment) among leading_lines.
+                            if any(el.comment is None for el in s.leading_lines):
+                                break
+                        name = _get_simple_assignment_name(s)
+                        if name is None:
+                            break
+                        nodes.append(s)
+                        j += 1
+                        continue
+                    # Stop at any other node
+                    break
+                if nodes:
+                    blocks.append(Block(i, j, tuple(nodes)))
+                    i = j
+                    continue
+        i += 1
+
+    return blocks
+
+
+# -------- Class-level support --------
+def find_flagged_constant_blocks_in_class(
+    classdef: cst.ClassDef, src: str
+) -> list[Block]:
+    """Find flagged constant blocks within a class body.
+
+    Returns Block records whose indices refer to classdef.body.body positions.
+    """
+    blocks: list[Block] = []
+    body_list = classdef.body.body
+    n = len(body_list)
+    i = 0
+    while i < n:
+        item = body_list[i]
+        if type(item) is cst.SimpleStatementLine:
+            has_flag = _stmt_has_flag(item, src) or _prev_line_has_flag(body_list, i)
+            if has_flag and _get_simple_assignment_name(item) is not None:
+                j = i
+                nodes: list[cst.SimpleStatementLine] = []
+                while j < n:
+                    s = body_list[j]
+                    if type(s) is cst.SimpleStatementLine:
+                        if j != i:
+                            # Stop the block ONLY on a blank line (no comment) among leading_lines.
+                            if any(el.comment is None for el in s.leading_lines):
+                                break
+                        name = _get_simple_assignment_name(s)
+                        if name is None:
+                            break
+                        nodes.append(s)
+                        j += 1
+                        continue
+                    break
+                if nodes:
+                    blocks.append(Block(i, j, tuple(nodes)))
+                    i = j
+                    continue
+        i += 1
+    return blocks
+
+
+def reorder_flagged_constants(module: cst.Module, src: str) -> cst.Module:
+    _flag_cache.clear()
+    _name_cache.clear()
+    blocks = find_flagged_constant_blocks(module, src)
+    if not blocks:
+        return module
+
+    new_body = list(module.body)
+    changed = False
+
+    # Process blocks from last to first to keep indices stable
+    for block in reversed(blocks):
+        sorted_nodes = sort_constants_block(block.nodes)
+        # sort_constants_block returns the input tuple itself when the block
+        # is already ordered, so identity is a reliable change signal.
+        if sorted_nodes is block.nodes:
+            continue
+        # Replace slice
+        new_body[block.start : block.end] = sorted_nodes
+        changed = True
+
+    # Return the module by identity when every block was already sorted, so
+    # callers (and the final .code comparison) skip the rebuilt tree.
+    if not changed:
+        return module
+    return module.with_changes(body=new_body)
+
+
+def reorder_flagged_constants_everywhere(module: cst.Module, src: str) -> cst.Module:
+    """Reorder flagged constant blocks at module level and within class bodies.
+
+    Both phases work on one lazily-copied body and share the flag memo, so
+    the module tree is rebuilt at most once instead of once per phase (and
+    not at all when every block is already sorted).
+    """
+    # Files without the flag anywhere — the overwhelmingly common case —
+    # need no traversal at all: one substring test settles it.
+    if FLAG_NAME not in src:
+        return module
+
+    _flag_cache.clear()
+    _name_cache.clear()
+    new_body: list[cst.CSTNode] | None = None
+
+    # Module-level blocks. Replacements are same-length permutations, so
+    # later indices stay valid.
+    for block in reversed(find_flagged_constant_blocks(module, src)):
+        sorted_nodes = sort_constants_block(block.nodes)
+        if sorted_nodes is block.nodes:
+            continue
+        if new_body is None:
+            new_body = list(module.body)
+        new_body[block.start : block.end] = sorted_nodes
+
+    # Class-level blocks.
+    for idx, node in enumerate(module.body):
+        if type(node) is not cst.ClassDef:
+            continue
+        class_body_list: list[cst.CSTNode] | None = None
+        for block in reversed(find_flagged_constant_blocks_in_class(node, src)):
+            sorted_nodes = sort_constants_block(block.nodes)
+            if sorted_nodes is block.nodes:
+                continue
+            if class_body_list is None:
+                class_body_list = list(node.body.body)
+            class_body_list[block.start : block.end] = sorted_nodes
+        if class_body_list is not None:
+            if new_body is None:
+                new_body = list(module.body)
+            new_body[idx] = node.with_changes(
+                body=node.body.with_changes(body=class_body_list)
+            )
+
+    if new_body is None:
+        return module
+    return module.with_changes(body=new_body)
+
+
+def reorder_flagged_constants_in_classes(module: cst.Module, src: str) -> cst.Module:
+    """Reorder flagged constant blocks inside all class definitions in the module."""
+    _flag_cache.clear()
+    _name_cache.clear()
+    changed = False
+    new_module_body = list(module.body)
+
+    for idx, node in enumerate(new_module_body):
+        if type(node) is cst.ClassDef:
+            class_body_list = list(node.body.body)
+            blocks = find_flagged_constant_blocks_in_class(node, src)
+            if not blocks:
+                continue
+            class_changed = False
+            # Apply from last to first within the class body
+            for block in reversed(blocks):
+                sorted_nodes = sort_constants_block(block.nodes)
+                if sorted_nodes is block.nodes:
+                    continue
+                class_body_list[block.start : block.end] = sorted_nodes
+                class_changed = True
+            if class_changed:
+                new_class_body = node.body.with_changes(body=class_body_list)
+                new_module_body[idx] = node.with_changes(body=new_class_body)
+                changed = True
+
+    if not changed:
+        return module
+    return module.with_changes(body=new_module_body)
+
+
+def sort_constants_block(
+    nodes: Sequence[cst.SimpleStatementLine],
+) -> Sequence[cst.SimpleStatementLine]:
+    """Return a new list of nodes sorted by variable name (case-insensitive).
+
+    Preserve the flag comment by attaching it to the first node of the
+    sorted block (even if a different node becomes first after sorting),
+    and clear flag lines from subsequent nodes to avoid duplicates.
+
+    Returns the input sequence unchanged (by identity) when already sorted.
+    """
+    if len(nodes) < 2:
+        return nodes
+
+    # Decorate-sort-undecorate: compute the lowercase key once per node, and
+    # carry the original index both for sort stability and to map each node
+    # back to its cleaned leading_lines without a per-node search.
+    decorated: list[tuple[str, int, cst.SimpleStatementLine]] = []
+    for index, node in enumerate(nodes):
+        name = _get_simple_assignment_name(node)
+        if name is None:
+            # Shouldn't happen given precondition
+            continue
+        decorated.append((_lkey(name), index, node))
+
+    # Blocks already in order are the common case on repeated runs: a single
+    # monotonicity scan over the keys skips the sort, the two throwaway node
+    # lists the old equality check built, and their O(n) compare.
+    for i in range(1, len(decorated)):
+        if decorated[i][0] < decorated[i - 1][0]:
+            break
+    else:
+        return nodes
+
+    sorted_decorated = sorted(decorated)
+
+    # Build new nodes preserving each node's original leading_lines, but move
+    # the flag comment lines to the new first node (removing them from
+    # others). One fused pass per node both cleans its leading_lines and
+    # captures the first node's flag lines, instead of filtering each list
+    # twice with a flag_exists call per comment per pass. Running it after
+    # the sorted short-circuit means clean blocks never scan leading_lines.
+    collected_flag_lines: list[cst.EmptyLine] = []
+    cleaned_leadings: list[list[cst.EmptyLine]] = []
+    for node in nodes:
+        cleaned: list[cst.EmptyLine] = []
+        flag_lines: list[cst.EmptyLine] = []
+        for el in node.leading_lines:
+            if el.comment is not None and _FLAG_RE.search(el.comment.value):
+                flag_lines.append(el)
+            else:
+                cleaned.append(el)
+        if flag_lines and not collected_flag_lines:
+            # Typically held by the original first node.
+            collected_flag_lines = flag_lines
+        cleaned_leadings.append(cleaned)
+
+    sorted_nodes: list[cst.SimpleStatementLine] = []
+
+    for idx, (_, original_index, node) in enumerate(sorted_decorated):
+        leading = cleaned_leadings[original_index]
+        if idx == 0 and collected_flag_lines:
+            leading = collected_flag_lines + list(leading)
+        sorted_nodes.append(node.with_changes(leading_lines=leading))
+    return sorted_nodes
+
+
+def _get_simple_assignment_name(stmt: cst.SimpleStatementLine) -> str | None:
+    key = id(stmt)
+    if key in _name_cache:
+        return _name_cache[key]
+    name = _uncached_simple_assignment_name(stmt)
+    _name_cache[key] = name
+    return name
+
+
+def _prev_line_has_flag(body_list: Sequence[cst.CSTNode], index: int) -> bool:
+    """Return True if the previous sibling is an EmptyLine whose comment contains the flag."""
+    if index - 1 < 0:
+        return False
+    prev = body_list[index - 1]
+    if type(prev) is cst.EmptyLine and prev.comment is not None:
+        return _FLAG_RE.search(prev.comment.value) is not None
+    return False
+
+
+def _uncached_simple_assignment_name(stmt: cst.SimpleStatementLine) -> str | None:
+    if len(stmt.body) != 1:
+        return None
+    small = stmt.body[0]
+    small_t = type(small)
+    if small_t is cst.Assign:
+        targets = small.targets
+        if len(targets) != 1:
+            return None
+        target = targets[0].target
+    elif small_t is cst.AnnAssign:
+        target = small.target
+    else:
+        return None
+    if type(target) is not cst.Name:
+        return None
+    value = target.value
+    return value if value.isupper() else None
+
+
+def _stmt_has_flag(stmt: cst.SimpleStatementLine, src: str) -> bool:
+    """Detect if a simple statement line is preceded by the filestate flag.
+
+    We look into leading_lines comments only; detection via a previous sibling
+    EmptyLine is handled by the callers. Do NOT fall back to scanning the
+    entire file, which would produce false positives.
+    """
+    key = id(stmt)
+    cached = _flag_cache.get(key)
+    if cached is not None:
+        return cached
+    result = False
+    for el in stmt.leading_lines:
+        if el.comment is not None:
+            # el.comment.value includes '#'
+            if _FLAG_RE.search(el.comment.value):
+                result = True
+                break
+    _flag_cache[key] = result
+    return result
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import libcst as cst
+
+
+def find_module_docstring(
+    module: cst.Module,
+) -> tuple[cst.SimpleStatementLine | None, int]:
+    """Find the module docstring in a CST module.
+
+    Args:
+        module: The CST module to search
+
+    Returns:
+        A tuple of (docstring_node, position) where position is the index
+        in module.body. Returns (None, -1) if no docstring found.
+    """
+    for i, stmt in enumerate(module.body):
+        # Hitting a non-simple statement (import, class, def) means there is
+        # no docstring; each node's type is probed exactly once.
+        if type(stmt) is not cst.SimpleStatementLine:
+            break
+        if len(stmt.body) == 1:
+            small = stmt.body[0]
+            if type(small) is cst.Expr and type(small.value) is cst.SimpleString:
+                # This is a string literal at module level - likely a docstring
+                return stmt, i
+
+    return None, -1
+
+
+def is_module_docstring_at_top(module: cst.Module) -> bool:
+    """Check if the module docstring is already at the top position.
+
+    Args:
+        module: The CST module to check
+
+    Returns:
+        True if docstring is at position 0, False otherwise
+    """
+    docstring_node, position = find_module_docstring(module)
+    return docstring_node is not None and position == 0
+
+
+def move_docstring_to_top(module: cst.Module) -> cst.Module:
+    """Move the module docstring to the top of the file.
+
+    Args:
+        module: The CST module to modify
+
+    Returns:
+        Modified module with docstring at the top
+    """
+    docstring_node, position = find_module_docstring(module)
+
+    if docstring_node is None or position == 0:
+        # No docstring or already at top
+        return module
+
+    # Normalize quotes and clear leading newlines in one rebuild of the
+    # statement instead of chaining two with_changes calls.
+    normalized_body = _normalized_docstring_body(docstring_node)
+    if normalized_body is None:
+        clean_docstring = docstring_node.with_changes(leading_lines=[])
+    else:
+        clean_docstring = docstring_node.with_changes(
+            body=normalized_body, leading_lines=[]
+        )
+
+    # Remove docstring from current position and insert at the beginning
+    new_body = list(module.body)
+    new_body.pop(position)
+    new_body.insert(0, clean_docstring)
+
+    return module.with_changes(body=new_body)
+
+
+def normalize_docstring_quotes(
+    docstring_node: cst.SimpleStatementLine,
+) -> cst.SimpleStatementLine:
+    """Convert single quotes to double quotes in docstring nodes.
+
+    Args:
+        docstring_node: A CST node containing a docstring statement
+
+    Returns:
+        The same node with normalized double quotes
+    """
+    new_body = _normalized_docstring_body(docstring_node)
+    if new_body is None:
+        # Already using double quotes (or not a plain string statement)
+        return docstring_node
+    return docstring_node.with_changes(body=new_body)
+
+
+def _normalized_docstring_body(
+    docstring_node: cst.SimpleStatementLine,
+) -> tuple[cst.BaseSmallStatement, ...] | None:
+    """Return the statement body with docstring quotes doubled, or None if unchanged.
+
+    Returning the body rather than a rebuilt statement lets callers fold the
+    quote change into whatever with_changes call they make anyway.
+    """
+    expr = docstring_node.body[0]
+    if type(expr) is not cst.Expr:
+        return None
+
+    string_value = expr.value
+    if type(string_value) is not cst.SimpleString:
+        return None
+
+    quote = string_value.quote
+
+    # Convert single quotes to double quotes
+    if quote.startswith("'''"):
+        new_quote = '"""'
+    elif quote.startswith("'"):
+        new_quote = '"'
+    else:
+        # Already using double quotes
+        return None
+
+    # A body containing the target quote (or ending with one, which would
+    # merge into a closing triple quote) breaks the rebuilt literal; leave
+    # those docstrings alone rather than emitting invalid code.
+    raw = string_value.raw_value
+    if new_quote in raw or raw.endswith('"'):
+        return None
+
+    # quote is a derived property on SimpleString, so rebuild the raw literal.
+    new_expr = expr.with_changes(
+        value=string_value.with_changes(
+            value=string_value.prefix + new_quote + raw + new_quote
+        )
+    )
+    # Docstring statements almost always hold a single small statement; build
+    # the body tuple directly in that common case.
+    if len(docstring_node.body) == 1:
+        return (new_expr,)
+    return (new_expr, *docstring_node.body[1:])
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+
+FLAG_NAME = "python-iterable-sort"
+
+# One compiled scan of the whole buffer replaces a per-line flag_exists call;
+# same syntax the shared helper accepts: own-line comment, optional indent,
+# flexible spacing around the colon.
+_FLAG_RE = re.compile(
+    rf"^[\t ]*#\s*filestate:\s*{re.escape(FLAG_NAME)}\b", flags=re.MULTILINE
+)
+
+# Indentation width in one C-level match instead of len minus lstrip, which
+# allocates a stripped copy just to measure it.
+_INDENT_RE = re.compile(r"[ \t]*")
+
+
+def reorder_flagged_iterables(src: str) -> str:
+    """Sort items of flagged iterable blocks (typically list literals) alphabetically.
+
+    - Looks for lines with '# filestate: python-iterable-sort'.
+    - Sorts the contiguous following element lines until a blank line or closing bracket.
+    - Preserves comments: a contiguous block of comment lines is attached to the
+      item immediately below it and moves with that item.
+    - Preserves indentation and commas; compares using a case-insensitive key on
+      the item line's stripped content.
+    - If already sorted, returns original src unchanged.
+
+    Changed blocks are spliced back by character offset, so everything outside
+    them — including the trailing-newline state of the file — survives
+    byte-for-byte instead of going through a splitlines/join round-trip.
+    """
+    if not src:
+        return src
+
+    flag_lines = _find_flag_line_indices(src)
+    if not flag_lines:
+        return src
+
+    raw_lines = src.splitlines(keepends=True)
+    lines = src.splitlines()
+    # Offset of each line's first character; one extra entry marks EOF so a
+    # block ending on the last line needs no special case.
+    line_starts = [0] * (len(raw_lines) + 1)
+    offset = 0
+    for i, raw in enumerate(raw_lines):
+        line_starts[i] = offset
+        offset += len(raw)
+    line_starts[len(raw_lines)] = offset
+
+    def split_into_groups(block_lines: list[str]) -> tuple[list[list[str]], list[str]]:
+        # Groups and their comparison keys come out as parallel arrays: the
+        # item line is already in hand when its group closes, so the key —
+        # stripped, trailing comma dropped, case folded — costs one slice
+        # here instead of a later rescan of each group for its item line.
+        groups: list[list[str]] = []
+        keys: list[str] = []
+        pending_comments: list[str] = []
+        for ln in block_lines:
+            if ln.lstrip().startswith("#"):
+                pending_comments.append(ln)
+                continue
+            # item line
+            group = pending_comments + [ln]
+            groups.append(group)
+            item = ln.strip()
+            if item.endswith(","):
+                item = item[:-1]
+            keys.append(item.casefold())
+            pending_comments = []
+        # Any trailing comments without item are ignored for sorting and left in place
+        # (shouldn't occur in expected usage). If present, attach to last group to preserve.
+        if pending_comments:
+            if groups:
+                groups[-1].extend(pending_comments)
+            else:
+                groups.append(pending_comments)
+                keys.append("")
+        return groups, keys
+
+    # Collect the rewritten regions first; every offset comes from the
+    # original buffer, so no edit invalidates another and the output can be
+    # assembled in one joining pass instead of K whole-source splices.
+    replacements: list[tuple[int, int, str]] = []
+    for flag_idx in flag_lines:
+        start, end = _collect_iterable_block(lines, flag_idx)
+        if start >= end:
+            continue
+        block = lines[start:end]
+
+        groups, keys = split_into_groups(block)
+        # Each key was computed exactly once; a linear nondecreasing scan
+        # settles the (common) already-sorted case without allocating a
+        # sorted copy or recomputing a single key.
+        if all(keys[i - 1] <= keys[i] for i in range(1, len(keys))):
+            continue
+
+        # Sort indices against the precomputed keys and flatten back to lines
+        new_block: list[str] = []
+        for j in sorted(range(len(groups)), key=keys.__getitem__):
+            new_block.extend(groups[j])
+
+        # Rejoin the permuted lines, keeping whatever line ending (or lack of
+        # one, at EOF) closed the original region.
+        final_ending = raw_lines[end - 1][len(lines[end - 1]) :]
+        replacements.append(
+            (line_starts[start], line_starts[end], "\n".join(new_block) + final_ending)
+        )
+
+    if not replacements:
+        return src
+
+    parts: list[str] = []
+    cursor = 0
+    for lo, hi, text in replacements:
+        # Consecutive flag lines resolve to the same block and yield
+        # duplicate regions; emitting one is enough, and anything starting
+        # before the cursor would double-copy text already written.
+        if lo < cursor:
+            continue
+        parts.append(src[cursor:lo])
+        parts.append(text)
+        cursor = hi
+    parts.append(src[cursor:])
+    return "".join(parts)
+
+
+def _collect_iterable_block(lines: list[str], flag_idx: int) -> tuple[int, int]:
+    """Given the index of the flag line, collect the contiguous item block range.
+
+    Returns (start_idx, end_idx_exclusive) of lines to sort. We start at the next
+    non-empty line after the flag, and stop before the first blank line or the
+    closing bracket ']' at the same or lesser indentation level. Comment lines
+    stay inside the block so split_into_groups can attach each run to the item
+    below it and move them together.
+    """
+    n = len(lines)
+    # Determine base indentation from the flag line
+    base_indent = _INDENT_RE.match(lines[flag_idx]).end()
+
+    # Start scanning after the flag line
+    i = flag_idx + 1
+    # Skip immediate blank lines (though the example shows none).
+    while i < n and not lines[i].strip():
+        i += 1
+    start = i
+
+    # Scan until blank line or closing bracket ']' at indentation <= base;
+    # indentation is only measured for ']' lines.
+    while i < n:
+        line = lines[i]
+        stripped = line.strip()
+        # Stop at blank separator line
+        if not stripped:
+            break
+        # Stop when list ends
+        if stripped[0] == "]" and _INDENT_RE.match(line).end() <= base_indent:
+            break
+        i += 1
+
+    end = i
+    return start, end
+
+
+def _find_flag_line_indices(src: str) -> list[int]:
+    """Return line indices where the iterable sort flag appears."""
+    matches = [m.start() for m in _FLAG_RE.finditer(src)]
+    if not matches:
+        return []
+    line_starts = [0]
+    nl = src.find("\n")
+    while nl != -1:
+        line_starts.append(nl + 1)
+        nl = src.find("\n", nl + 1)
+    return [bisect_right(line_starts, pos) - 1 for pos in matches]
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import libcst as cst
+
+from wexample_filestate_python.operation.utils.cached_dispatch import (
+    CachedVisitorDispatchMixin,
+)
+
+if TYPE_CHECKING:
+    from wexample_filestate_python.operation.utils.relocate_imports.python_parser_import_index import (
+        PythonParserImportIndex,
+    )
+    from wexample_filestate_python.operation.utils.relocate_imports.python_runtime_symbol_collector import (
+        PythonRuntimeSymbolCollector,
+    )
+    from wexample_filestate_python.operation.utils.relocate_imports.python_usage_collector import (
+        PythonUsageCollector,
+    )
+
+
+class CombinedImportVisitor(CachedVisitorDispatchMixin, cst.CSTVisitor):
+    """Run the import index, usage collector and runtime-symbol collector in one walk.
+
+    The three collectors are independent ``cst.CSTVisitor`` subclasses that
+    used to run back to back over the same module, each paying libcst's
+    per-node dispatch across the whole tree. This visitor implements the
+    union of their handlers and forwards each to the collectors that define
+    it, so the tree is traversed once. The collectors keep their own stacks:
+    the duplicate push/pop pairs are cheap next to the traversal itself, and
+    sharing them would couple the classes for no measurable win.
+
+    The usage and runtime collectors read ``imported_value_names``, which
+    the sequential pipeline snapshot from the finished index. Here the set
+    is filled in as import statements are indexed; imports precede the code
+    that uses them in any well-formed module, so by the time a usage site is
+    visited the set holds the same names the snapshot would have.
+    """
+
+    def __init__(
+        self,
+        *,
+        idx: PythonParserImportIndex,
+        usage: PythonUsageCollector,
+        runtime: PythonRuntimeSymbolCollector,
+        imported_value_names: set[str],
+    ) -> None:
+        super().__init__()
+        self.idx = idx
+        self.usage = usage
+        self.runtime = runtime
+        self.imported_value_names = imported_value_names
+
+    def leave_Annotation(self, node: cst.Annotation) -> None:  # type: ignore[override]
+        self.usage.leave_Annotation(node)
+        self.runtime.leave_Annotation(node)
+
+    def leave_ClassDef(self, node: cst.ClassDef) -> None:  # type: ignore[override]
+        self.idx.leave_ClassDef(node)
+        self.usage.leave_ClassDef(node)
+
+    def leave_Decorator(self, node: cst.Decorator) -> None:  # type: ignore[override]
+        self.usage.leave_Decorator(node)
+
+    def leave_FunctionDef(self, node: cst.FunctionDef) -> None:  # type: ignore[override]
+        self.idx.leave_FunctionDef(node)
+        self.usage.leave_FunctionDef(node)
+
+    def visit_AnnAssign(self, node: cst.AnnAssign) -> None:  # type: ignore[override]
+        self.usage.visit_AnnAssign(node)
+
+    def visit_Annotation(self, node: cst.Annotation) -> None:  # type: ignore[override]
+        self.usage.visit_Annotation(node)
+        self.runtime.visit_Annotation(node)
+
+    def visit_Assign(self, node: cst.Assign) -> None:  # type: ignore[override]
+        self.usage.visit_Assign(node)
+
+    def visit_Call(self, node: cst.Call) -> None:  # type: ignore[override]
+        self.usage.visit_Call(node)
+
+    def visit_ClassDef(self, node: cst.ClassDef) -> None:  # type: ignore[override]
+        self.idx.visit_ClassDef(node)
+        self.usage.visit_ClassDef(node)
+
+    def visit_Decorator(self, node: cst.Decorator) -> None:  # type: ignore[override]
+        self.usage.visit_Decorator(node)
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:  # type: ignore[override]
+        self.idx.visit_FunctionDef(node)
+        self.usage.visit_FunctionDef(node)
+
+    def visit_Import(self, node: cst.Import) -> bool:  # type: ignore[override]
+        self.idx.visit_Import(node)
+        # Prune the subtree: the Names inside an import statement are
+        # bindings, not uses, and the usage/runtime halves would otherwise
+        # record every imported name as runtime-used.
+        return False
+
+    def visit_ImportFrom(self, node: cst.ImportFrom) -> bool:  # type: ignore[override]
+        self.idx.visit_ImportFrom(node)
+        # Newly indexed names become visible to the usage/runtime halves
+        # before any code that could reference them is visited.
+        self.imported_value_names.update(self.idx.name_to_from)
+        return False
+
+    def visit_Name(self, node: cst.Name) -> None:  # type: ignore[override]
+        self.usage.visit_Name(node)
+        self.runtime.visit_Name(node)
+
+    def visit_Param(self, node: cst.Param) -> None:  # type: ignore[override]
+        self.usage.visit_Param(node)
+
+    def visit_Parameters(self, node: cst.Parameters) -> None:  # type: ignore[override]
+        self.usage.visit_Parameters(node)
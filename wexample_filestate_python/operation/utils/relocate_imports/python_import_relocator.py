@@ -0,0 +1,692 @@
+from __future__ import annotations
+
+import sys
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, DefaultDict
+
+import libcst as cst
+
+from wexample_filestate_python.operation.utils.cached_dispatch import (
+    CachedTransformerDispatchMixin,
+)
+from wexample_filestate_python.operation.utils.python_type_checking_utils import (
+    _is_type_checking_test,
+)
+
+if TYPE_CHECKING:
+    from wexample_filestate_python.operation.utils.relocate_imports.python_parser_import_index import (
+        PythonParserImportIndex,
+    )
+
+# Shared default for index lookups so the miss path hands back one
+# preallocated tuple instead of building a fresh triple per call.
+_UNRESOLVED: tuple[None, None, None] = (None, None, None)
+
+# One pooled relocator per thread, handed out by for_file(); keeping it here
+# rather than on the class avoids sharing visit state across threads.
+_pool = threading.local()
+
+
+@lru_cache(maxsize=1024)
+def _parse_import_stmt(mod: str, names: tuple[str, ...]) -> cst.BaseStatement:
+    """Parse `from <mod> import <names>` once per distinct shape.
+
+    libcst nodes are immutable and freely shareable, so the same statement
+    tree can sit in any number of parents; repeat shapes (the typical
+    project imports the same few symbols all over) skip the parser entirely.
+    """
+    return cst.parse_statement(f"from {mod} import {', '.join(names)}")
+
+
+class PythonImportRelocator(CachedTransformerDispatchMixin, cst.CSTTransformer):
+    """Rewrite module-level imports and inject function-local imports in one pass.
+
+    This merges what used to be two full-module transformer passes (an import
+    rewriter followed by a runtime-import localizer) so each node is visited
+    once:
+    - Removing symbols that will be localized to functions (A) or moved under
+      TYPE_CHECKING (C-only)
+    - Keeping symbols used at class-level property annotations (B)
+    - Adding a TYPE_CHECKING block with required imports for C-only symbols
+    - Ensuring `from typing import TYPE_CHECKING` is present
+    - Inserting grouped `from <module> import Name` statements at the top of
+      each function listed in `functions_needing_local`, after a docstring if
+      present
+
+    The module-level rewrites and the function-body injections touch disjoint
+    parts of the tree, so fusing the passes does not change either result.
+    """
+
+    def __init__(
+        self,
+        *,
+        used_in_B: set[str],
+        names_to_remove_from_module: set[str],
+        used_in_C_only: set[str],
+        idx: PythonParserImportIndex,
+        functions_needing_local: DefaultDict[str, set[str]],
+        skip_local_names: set[str] | None = None,
+    ) -> None:
+        super().__init__()
+        self.used_in_B = used_in_B
+        self.names_to_remove_from_module = names_to_remove_from_module
+        self.used_in_C_only = used_in_C_only
+        self.idx = idx
+        self.functions_needing_local = functions_needing_local
+        self.skip_local_names = skip_local_names or set()
+        # The stack of enclosing class names drives the module-level checks
+        # and subtree pruning; the running dotted prefix mirrors it so each
+        # function's qualified name is one concatenation, not a list join.
+        self.class_stack: list[str] = []
+        # Memo for _module_str keyed on node identity: imports sharing a
+        # dotted module path often share the very same Attribute chain. The
+        # entry keeps a reference to the node itself — transient updated
+        # nodes get collected once a leave_* method discards them, and a
+        # recycled id must not replay the old node's answer.
+        self._mod_str_cache: dict[int, tuple[cst.BaseExpression, str | None]] = {}
+        self._reset_traversal_state()
+        self._rebuild_derived()
+
+    @classmethod
+    def for_file(
+        cls,
+        *,
+        used_in_B: set[str],
+        names_to_remove_from_module: set[str],
+        used_in_C_only: set[str],
+        idx: PythonParserImportIndex,
+        functions_needing_local: DefaultDict[str, set[str]],
+        skip_local_names: set[str] | None = None,
+    ) -> PythonImportRelocator:
+        """Hand out the thread-pooled relocator, reset for this file.
+
+        Instantiating per file rebuilds every derived structure from
+        scratch even when consecutive files resolve to the same plans;
+        reusing one instance per thread lets reset() skip that rebuild
+        when the inputs are unchanged.
+        """
+        inst: PythonImportRelocator | None = getattr(_pool, "relocator", None)
+        if inst is None:
+            inst = cls(
+                used_in_B=used_in_B,
+                names_to_remove_from_module=names_to_remove_from_module,
+                used_in_C_only=used_in_C_only,
+                idx=idx,
+                functions_needing_local=functions_needing_local,
+                skip_local_names=skip_local_names,
+            )
+            _pool.relocator = inst
+        else:
+            inst.reset(
+                used_in_B=used_in_B,
+                names_to_remove_from_module=names_to_remove_from_module,
+                used_in_C_only=used_in_C_only,
+                idx=idx,
+                functions_needing_local=functions_needing_local,
+                skip_local_names=skip_local_names,
+            )
+        return inst
+
+    @staticmethod
+    def _make_import_stmt(mod: str | None, names: list[str]) -> cst.BaseStatement:
+        """Build `from <mod> import <names>` as a statement line.
+
+        For the common resolved-module shape the whole tree comes out of
+        libcst's parser in one call — memoized on the (module, names) pair —
+        which beats instantiating (and validating) every ImportFrom/
+        ImportAlias/Name node by hand. The hand-built path remains only for
+        an unresolved module.
+        """
+        if mod is not None:
+            return _parse_import_stmt(mod, tuple(names))
+        # Each entry is an import clause — either a bare name or
+        # "Name as Alias" — so the hand-built path splits it back apart.
+        aliases: list[cst.ImportAlias] = []
+        for n in names:
+            base, _, asn = n.partition(" as ")
+            aliases.append(
+                cst.ImportAlias(name=cst.Name(base))
+                if not asn
+                else cst.ImportAlias(
+                    name=cst.Name(base), asname=cst.AsName(name=cst.Name(asn))
+                )
+            )
+        return cst.SimpleStatementLine((cst.ImportFrom(module=None, names=tuple(aliases)),))
+
+    @staticmethod
+    def _flatten_module_expr_to_str(module: cst.BaseExpression | None) -> str | None:
+        if module is None:
+            return None
+        if isinstance(module, cst.Name):
+            return module.value
+        if isinstance(module, cst.Attribute):
+            parts: list[str] = []
+            cur: cst.BaseExpression | None = module
+            while isinstance(cur, cst.Attribute):
+                if isinstance(cur.attr, cst.Name):
+                    parts.append(cur.attr.value)
+                else:
+                    break
+                cur = cur.value
+            if isinstance(cur, cst.Name):
+                parts.append(cur.value)
+            parts.reverse()
+            return ".".join(parts) if parts else None
+        return None
+
+    def _module_str(self, module: cst.BaseExpression | None) -> str | None:
+        """Memoized _flatten_module_expr_to_str for this transformer's nodes."""
+        if module is None:
+            return None
+        key = id(module)
+        cache = self._mod_str_cache
+        hit = cache.get(key)
+        if hit is not None and hit[0] is module:
+            return hit[1]
+        val = self._flatten_module_expr_to_str(module)
+        cache[key] = (module, val)
+        return val
+
+    def reset(
+        self,
+        *,
+        used_in_B: set[str],
+        names_to_remove_from_module: set[str],
+        used_in_C_only: set[str],
+        idx: PythonParserImportIndex,
+        functions_needing_local: DefaultDict[str, set[str]],
+        skip_local_names: set[str] | None = None,
+    ) -> None:
+        """Re-point the per-file inputs, keeping derived structures when possible.
+
+        The derived structures (_sorted_c_by_mod, _local_plans,
+        _class_prefixes) are pure functions of the C-only set, the local
+        plans inputs and the index's name_to_from map, so they survive the
+        reset whenever all of those compare equal to the previous file's —
+        common for runs over files sharing the same few imports.
+        """
+        skip = skip_local_names or set()
+        unchanged = (
+            used_in_C_only == self.used_in_C_only
+            and functions_needing_local == self.functions_needing_local
+            and skip == self.skip_local_names
+            and idx.name_to_from == self.idx.name_to_from
+        )
+        self.used_in_B = used_in_B
+        self.names_to_remove_from_module = names_to_remove_from_module
+        self.used_in_C_only = used_in_C_only
+        self.idx = idx
+        self.functions_needing_local = functions_needing_local
+        self.skip_local_names = skip
+        self._reset_traversal_state()
+        if not unchanged:
+            self._rebuild_derived()
+
+    def leave_ClassDef(self, original_node: cst.ClassDef, updated_node: cst.ClassDef) -> cst.BaseStatement:  # type: ignore[override]
+        name = self.class_stack.pop()
+        # The prefix always ends with this class's name plus the dot.
+        self._qname_prefix = self._qname_prefix[: -(len(name) + 1)]
+        return updated_node
+
+    def leave_FunctionDef(self, original_node: cst.FunctionDef, updated_node: cst.FunctionDef) -> cst.BaseStatement:  # type: ignore[override]
+        self._func_depth -= 1
+        func_qname = self._qname_prefix + original_node.name.value
+        # Consolidated imports and pairs to hoist, precomputed in __init__
+        plan = self._local_plans.get(func_qname)
+        if plan is None:
+            return updated_node
+        to_inject, pairs = plan
+
+        relocator = self
+
+        # If all target imports are already present somewhere in the function
+        # body, avoid rewriting to preserve existing order/formatting. The
+        # index recorded each function's local from-imports during its walk,
+        # so this settles on a dict probe; the body scan survives only as a
+        # fallback for a qname the index never saw.
+        def _collect_current_pairs(fn: cst.FunctionDef) -> set[tuple[str | None, str]]:
+            found: set[tuple[str | None, str]] = set()
+
+            class _Find(cst.CSTVisitor):
+                def leave_ImportFrom(self, node: cst.ImportFrom) -> None:  # type: ignore[override]
+                    if node.names is None or isinstance(node.names, cst.ImportStar):
+                        return
+                    mod = relocator._module_str(node.module)
+                    for alias in node.names:
+                        if isinstance(alias, cst.ImportAlias) and isinstance(
+                            alias.name, cst.Name
+                        ):
+                            found.add((mod, alias.name.value))
+
+                def leave_Import(self, node: cst.Import) -> None:  # type: ignore[override]
+                    return
+
+            fn.visit(_Find())
+            return found
+
+        existing = self.idx.function_local_imports.get(func_qname)
+        if existing is None:
+            existing = _collect_current_pairs(updated_node)
+        if pairs.issubset(existing):
+            # No injection needed for this function, but updated_node still
+            # carries rewrites from deeper in the walk (a nested function's
+            # injected imports) — reverting to original_node would drop them.
+            return updated_node
+
+        # First prune matching imports anywhere within the function body
+        class _PruneInner(cst.CSTTransformer):
+            def leave_ImportFrom(self, original_node: cst.ImportFrom, updated_node: cst.ImportFrom):  # type: ignore[override]
+                if updated_node.names is None or isinstance(
+                    updated_node.names, cst.ImportStar
+                ):
+                    return updated_node
+                mod = relocator._module_str(updated_node.module)
+                kept_aliases: list[cst.ImportAlias] = []
+                for alias in updated_node.names:
+                    if not isinstance(alias, cst.ImportAlias):
+                        continue
+                    name = (
+                        alias.name.value if isinstance(alias.name, cst.Name) else None
+                    )
+                    if not name:
+                        continue
+                    if (mod, name) in pairs:
+                        continue
+                    kept_aliases.append(alias)
+                if not kept_aliases:
+                    return cst.RemoveFromParent()
+                return updated_node.with_changes(names=tuple(kept_aliases))
+
+        pruned_node = updated_node.visit(_PruneInner())
+        body = list(pruned_node.body.body)
+        insert_at = 0
+        if (
+            body
+            and isinstance(body[0], cst.SimpleStatementLine)
+            and any(
+                isinstance(el, cst.Expr) and isinstance(el.value, cst.SimpleString)
+                for el in body[0].body
+            )
+        ):
+            insert_at = 1
+        new_body = body[:insert_at] + to_inject + body[insert_at:]
+        return pruned_node.with_changes(
+            body=pruned_node.body.with_changes(body=new_body)
+        )
+
+    def leave_If(self, original_node: cst.If, updated_node: cst.If) -> cst.If:  # type: ignore[override]
+        if _is_type_checking_test(original_node.test):
+            self._tc_depth -= 1
+        return updated_node
+
+    def leave_Import(
+        self, original_node: cst.Import, updated_node: cst.Import
+    ) -> cst.RemovalSentinel | cst.BaseSmallStatement:
+        # Only handle module-level imports
+        if self.class_stack or self._func_depth:
+            return updated_node
+        kept_aliases: list[cst.ImportAlias] = []
+        removed_any = False
+        for alias in updated_node.names:
+            if not isinstance(alias, cst.ImportAlias):
+                continue
+            name = alias.name.value if isinstance(alias.name, cst.Name) else None
+            if not name:
+                # Dotted `import pkg.sub [as x]`: the relocation plans come
+                # exclusively from from-imports, so there is never a local or
+                # TYPE_CHECKING injection to pair with a removal here —
+                # dropping the alias would just delete the binding.
+                kept_aliases.append(alias)
+                continue
+            alias_ident = alias.asname.name.value if alias.asname else name
+
+            # Keep B at module level
+            if alias_ident in self.used_in_B:
+                kept_aliases.append(alias)
+                continue
+
+            # Drop if moved to TYPE_CHECKING or localized (A or C-only)
+            if alias_ident in self.names_to_remove_from_module:
+                removed_any = True
+                continue
+
+            kept_aliases.append(alias)
+
+        if not kept_aliases:
+            return cst.RemoveFromParent()
+
+        # If nothing changed (same number of aliases kept as original and none removed),
+        # return the original node to preserve exact formatting (commas, parentheses, whitespace).
+        try:
+            original_alias_count = len(original_node.names) if not isinstance(original_node.names, cst.ImportStar) else 0  # type: ignore[arg-type]
+        except Exception:
+            original_alias_count = -1
+        if original_alias_count == len(kept_aliases) and not removed_any:
+            return original_node
+
+        # Only the alias that ends up last can carry a stale trailing comma;
+        # every other kept alias (and its comma formatting) passes through by
+        # reference instead of being reallocated.
+        last = kept_aliases[-1]
+        if last.comma is not cst.MaybeSentinel.DEFAULT:
+            kept_aliases[-1] = last.with_changes(comma=cst.MaybeSentinel.DEFAULT)
+        return updated_node.with_changes(names=tuple(kept_aliases))
+
+    def leave_ImportFrom(
+        self, original_node: cst.ImportFrom, updated_node: cst.ImportFrom
+    ) -> cst.RemovalSentinel | cst.BaseSmallStatement:
+        # Detect `from typing import TYPE_CHECKING` here, where an ImportFrom
+        # is already in hand, instead of re-inspecting every statement line in
+        # a leave_SimpleStatementLine pass.
+        if (
+            not self.found_type_checking_import
+            and isinstance(updated_node.module, cst.Name)
+            and updated_node.module.value == "typing"
+            and updated_node.names
+            and not isinstance(updated_node.names, cst.ImportStar)
+        ):
+            for alias in updated_node.names:
+                if (
+                    isinstance(alias, cst.ImportAlias)
+                    and isinstance(alias.name, cst.Name)
+                    and alias.name.value == "TYPE_CHECKING"
+                ):
+                    self.found_type_checking_import = True
+                    break
+
+        # Only handle module-level imports
+        if self.class_stack or self._func_depth:
+            return updated_node
+        if updated_node.names is None or isinstance(updated_node.names, cst.ImportStar):
+            return updated_node
+
+        # If we're already inside a TYPE_CHECKING block, do not filter out C-only names here.
+        if self._tc_depth:
+            return updated_node
+
+        mod_str = self._module_str(updated_node.module)
+
+        kept_aliases: list[cst.ImportAlias] = []
+        removed_any = False
+        for alias in updated_node.names:
+            if not isinstance(alias, cst.ImportAlias):
+                continue
+            name = alias.name.value if isinstance(alias.name, cst.Name) else None
+            if not name:
+                continue
+            alias_ident = alias.asname.name.value if alias.asname else name
+
+            # Always keep non-TYPE_CHECKING imports from typing at module level
+            if mod_str == "typing" and name != "TYPE_CHECKING":
+                kept_aliases.append(alias)
+                continue
+
+            # Keep B at module level
+            if alias_ident in self.used_in_B:
+                kept_aliases.append(alias)
+                continue
+
+            # Drop if moved to TYPE_CHECKING or localized (A or C-only)
+            if alias_ident in self.names_to_remove_from_module:
+                removed_any = True
+                continue
+
+            kept_aliases.append(alias)
+
+        if not kept_aliases:
+            return cst.RemoveFromParent()
+
+        # If nothing changed (same number of aliases kept as original and none removed),
+        # return the original node to preserve exact formatting (commas, parentheses, whitespace).
+        try:
+            original_alias_count = len(original_node.names) if not isinstance(original_node.names, cst.ImportStar) else 0  # type: ignore[arg-type]
+        except Exception:
+            original_alias_count = -1
+        if original_alias_count == len(kept_aliases) and not removed_any:
+            return original_node
+
+        # Only the alias that ends up last can carry a stale trailing comma;
+        # every other kept alias (and its comma formatting) passes through by
+        # reference instead of being reallocated.
+        last = kept_aliases[-1]
+        if last.comma is not cst.MaybeSentinel.DEFAULT:
+            kept_aliases[-1] = last.with_changes(comma=cst.MaybeSentinel.DEFAULT)
+        return updated_node.with_changes(names=tuple(kept_aliases))
+
+    def leave_Module(
+        self, original_node: cst.Module, updated_node: cst.Module
+    ) -> cst.Module:
+        if not self.need_type_checking_block or not self.used_in_C_only:
+            return updated_node
+
+        # Desired imports for C-only, grouped per module in __init__.
+        by_module = self._sorted_c_by_mod
+
+        # One pass over the top-level body serves both scans: the search for
+        # an existing TYPE_CHECKING block and the insertion point for a new
+        # one. The insertion point sits after the module docstring and the
+        # leading run of import statements (whether the __future__ imports
+        # come first or not, the run is what matters), and the loop ends as
+        # soon as an existing block turns up, since the insertion point is
+        # only needed when there is none.
+        existing_tc_index = None
+        existing_tc_body: list[cst.BaseStatement] | None = None
+        existing_imported: set[tuple[str | None, str]] = set()
+        insert_index = 0
+        in_prefix = True
+
+        for i, stmt in enumerate(updated_node.body):
+            if isinstance(stmt, cst.If) and _is_type_checking_test(stmt.test):
+                existing_tc_index = i
+                existing_tc_body = list(stmt.body.body)
+                # Collect names already imported there
+                for s in existing_tc_body:
+                    if (
+                        isinstance(s, cst.SimpleStatementLine)
+                        and len(s.body) == 1
+                        and isinstance(s.body[0], cst.ImportFrom)
+                    ):
+                        imp: cst.ImportFrom = s.body[0]
+                        mod = self._module_str(imp.module)
+                        if imp.names and not isinstance(imp.names, cst.ImportStar):
+                            for alias in imp.names:
+                                if isinstance(alias, cst.ImportAlias) and isinstance(
+                                    alias.name, cst.Name
+                                ):
+                                    existing_imported.add((mod, alias.name.value))
+                break
+            if in_prefix:
+                if isinstance(stmt, cst.SimpleStatementLine) and stmt.body:
+                    if isinstance(stmt.body[0], (cst.Import, cst.ImportFrom)):
+                        insert_index = i + 1
+                        continue
+                    # Module docstring at the very top
+                    if i == 0 and any(
+                        isinstance(el, cst.Expr)
+                        and isinstance(el.value, cst.SimpleString)
+                        for el in stmt.body
+                    ):
+                        insert_index = 1
+                        continue
+                in_prefix = False
+
+        # Compute missing imports; names stay sorted, empty modules are
+        # dropped. Clauses may read "Name as Alias", while the existing set
+        # records original names — compare on the part before the alias.
+        missing_by_module: dict[str | None, list[str]] = {}
+        for mod, names in by_module.items():
+            missing = [
+                n for n in names if (mod, n.partition(" as ")[0]) not in existing_imported
+            ]
+            if missing:
+                missing_by_module[mod] = missing
+
+        if existing_tc_index is not None and existing_tc_body is not None:
+            # Append missing imports to existing TYPE_CHECKING block
+            additions: list[cst.BaseStatement] = []
+            for mod, names in missing_by_module.items():
+                additions.append(self._make_import_stmt(mod, names))
+            if not additions:
+                # Nothing to add at module level, but updated_node still
+                # carries the import rewrites and function-body injections
+                # from this same walk — falling back to original_node here
+                # would silently revert them.
+                return updated_node
+            new_tc = updated_node.body[existing_tc_index].with_changes(
+                body=cst.IndentedBlock(body=existing_tc_body + additions)
+            )
+            new_body = list(updated_node.body)
+            new_body[existing_tc_index] = new_tc
+            return updated_node.with_changes(body=new_body)
+
+        # Otherwise, create a new TYPE_CHECKING block placed after imports
+        type_checking_body: list[cst.BaseStatement] = []
+        for mod, names in missing_by_module.items():
+            type_checking_body.append(self._make_import_stmt(mod, names))
+
+        if not type_checking_body:
+            return updated_node
+
+        typing_import_stmt = cst.SimpleStatementLine(
+            (
+                cst.ImportFrom(
+                    module=cst.Name("typing"),
+                    names=(cst.ImportAlias(name=cst.Name("TYPE_CHECKING")),),
+                ),
+            )
+        )
+
+        type_checking_if = cst.If(
+            test=cst.Name("TYPE_CHECKING"),
+            body=cst.IndentedBlock(body=type_checking_body),
+        )
+
+        # Splice all additions in one slice assignment instead of repeated
+        # insert() calls, which each shift the tail of the list.
+        inserts: list[cst.BaseStatement] = []
+        # Ensure typing import exists somewhere before the TYPE_CHECKING block
+        if not self.found_type_checking_import:
+            inserts.append(typing_import_stmt)
+        inserts.append(type_checking_if)
+
+        new_body = list(updated_node.body)
+        new_body[insert_index:insert_index] = inserts
+
+        return updated_node.with_changes(body=new_body)
+
+    def visit_ClassDef(self, node: cst.ClassDef) -> bool:  # type: ignore[override]
+        self.class_stack.append(node.name.value)
+        self._qname_prefix = f"{self._qname_prefix}{node.name.value}."
+        # Pruned subtrees still get their leave_ClassDef call, so the stack
+        # stays balanced. The prefix test only applies at the top level:
+        # nested class qnames all begin with the outermost class name.
+        if (
+            len(self.class_stack) == 1
+            and self._func_depth == 0
+            and node.name.value not in self._class_prefixes
+        ):
+            return False
+        return True
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:  # type: ignore[override]
+        self._func_depth += 1
+        if not self.class_stack and not self._local_plans:
+            return False
+        return True
+
+    def visit_If(self, node: cst.If) -> bool:  # type: ignore[override]
+        # Track whether we are under `if TYPE_CHECKING:` (bare or typing-qualified)
+        if _is_type_checking_test(node.test):
+            self._tc_depth += 1
+        return True
+
+    def _build_local_imports(
+        self, func_qname: str
+    ) -> tuple[list[cst.BaseStatement], set[tuple[str | None, str]]]:
+        from collections import defaultdict
+
+        names = self.functions_needing_local.get(func_qname)
+        if not names:
+            return [], set()
+        # Group by module; the lookup resolves to one bound-method local
+        # instead of two attribute hops per iteration.
+        by_module: DefaultDict[str | None, list[str]] = defaultdict(list)
+        pairs: set[tuple[str | None, str]] = set()
+        nget = self.idx.name_to_from.get
+        for ident in sorted(names):
+            if ident in self.skip_local_names:
+                continue
+            mod, orig, asname = nget(ident, _UNRESOLVED)
+            # Skip unresolved modules to avoid invalid ImportFrom(module=None)
+            if mod is None:
+                continue
+            # Never inject local imports from typing; keep them at module level
+            if mod == "typing":
+                continue
+            # Rebuild the original clause: an aliased import binds `ident`
+            # but must be re-imported as `orig as ident-or-asname`, not by
+            # the bound identifier. Pairs track the original name, matching
+            # what the index and the body pruner record.
+            by_module[mod].append(orig if asname is None else f"{orig} as {asname}")
+            pairs.add((mod, orig))
+        stmts: list[cst.BaseStatement] = []
+        for mod, clauses in by_module.items():
+            if not clauses:
+                continue
+            # clauses came out of the sorted(names) loop above, so the lists
+            # are already in order — no re-sort per module.
+            stmts.append(self._make_import_stmt(mod, clauses))
+        return stmts, pairs
+
+    def _rebuild_derived(self) -> None:
+        # The desired TYPE_CHECKING imports are fixed by the inputs, so the
+        # whole grouping happens here: one sorted pass resolves each C-only
+        # name through the index (module strings interned — grouped imports
+        # share them) and leaves every per-module list sorted for free.
+        # typing.* never moves under TYPE_CHECKING.
+        self._sorted_c_by_mod: dict[str | None, list[str]] = {}
+        nget = self.idx.name_to_from.get
+        for ident in sorted(self.used_in_C_only):
+            mod, orig, asname = nget(ident, _UNRESOLVED)
+            if mod == "typing":
+                continue
+            if mod is not None:
+                mod = sys.intern(mod)
+            # Aliased imports are re-emitted as their original clause; the
+            # bound identifier alone would import the wrong symbol.
+            clause = ident if asname is None else f"{orig} as {asname}"
+            self._sorted_c_by_mod.setdefault(mod, []).append(clause)
+        # Local-import plans are a pure function of the name sets and the
+        # import index, all fixed until the next reset, so they are built
+        # once up front. leave_FunctionDef then pays a single dict probe
+        # for the (typical) function that needs no injection, and the
+        # grouping/sorting work is never repeated per visit.
+        self._local_plans: dict[
+            str, tuple[list[cst.BaseStatement], set[tuple[str | None, str]]]
+        ] = {}
+        for func_qname in self.functions_needing_local:
+            to_inject, pairs = self._build_local_imports(func_qname)
+            if to_inject:
+                self._local_plans[func_qname] = (to_inject, pairs)
+        # Subtree pruning index: every plan's qname starts with either a
+        # top-level class name or a bare function name, so a top-level class
+        # outside this prefix set cannot contain an injection target and its
+        # whole subtree can be skipped. Module-level functions are only
+        # skipped when there are no plans at all — a nested def or class
+        # inside one can still produce a matching qname.
+        self._class_prefixes: set[str] = {
+            qn.split(".", 1)[0] for qn in self._local_plans
+        }
+
+    def _reset_traversal_state(self) -> None:
+        self.found_type_checking_import = False
+        self.class_stack.clear()
+        self._qname_prefix: str = ""
+        self._func_depth: int = 0
+        self.need_type_checking_block: bool = len(self.used_in_C_only) > 0
+        # Depth of enclosing `if TYPE_CHECKING:` blocks. Only "inside one at
+        # all" is ever asked, so a counter replaces the per-If bool stack;
+        # leave_If re-tests the original node to know whether to decrement.
+        self._tc_depth: int = 0
+        self._mod_str_cache.clear()
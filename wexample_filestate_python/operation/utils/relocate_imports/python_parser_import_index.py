@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import libcst as cst
+
+from wexample_filestate_python.operation.utils.cached_dispatch import (
+    CachedVisitorDispatchMixin,
+)
+
+
+# Collect existing from-imports into a map: bound_name -> (module, name, alias).
+# The key is the identifier the import binds (the alias when present); the
+# original name rides along so rebuilt imports can emit `Name as Alias`.
+# Only handle `from pkg import Name [as Alias]`. Skip star imports and bare `import pkg`.
+class PythonParserImportIndex(CachedVisitorDispatchMixin, cst.CSTVisitor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.name_to_from: dict[str, tuple[str | None, str, str | None]] = {}
+        self.importfrom_nodes: list[cst.ImportFrom] = []
+        self.other_import_nodes: list[cst.Import] = []
+        # From-imports seen anywhere inside each function body (nested defs
+        # included), keyed by the same qualified name the relocator builds
+        # from enclosing class names. Every visited function gets an entry,
+        # so a missing key means the function was never indexed, not merely
+        # import-free.
+        self.function_local_imports: dict[str, set[tuple[str | None, str]]] = {}
+        # Running dotted prefix of the enclosing class names ("Outer.Inner."),
+        # so each function's qualified name is one concatenation instead of a
+        # list join per function.
+        self._qname_prefix: str = ""
+        self._func_qname_stack: list[str] = []
+
+    @staticmethod
+    def _flatten_module_name(module: cst.BaseExpression | None) -> str | None:
+        if module is None:
+            return None
+        if isinstance(module, cst.Name):
+            return module.value
+        if isinstance(module, cst.Attribute):
+            parts: list[str] = []
+            cur: cst.BaseExpression | None = module
+            while isinstance(cur, cst.Attribute):
+                if isinstance(cur.attr, cst.Name):
+                    parts.append(cur.attr.value)
+                else:
+                    break
+                cur = cur.value
+            if isinstance(cur, cst.Name):
+                parts.append(cur.value)
+            parts.reverse()
+            return ".".join(parts) if parts else None
+        if isinstance(module, cst.SimpleString):
+            return module.evaluated_value
+        return None
+
+    def leave_ClassDef(self, node: cst.ClassDef) -> None:  # type: ignore[override]
+        # The prefix always ends with this class's name plus the dot.
+        self._qname_prefix = self._qname_prefix[: -(len(node.name.value) + 1)]
+
+    def leave_FunctionDef(self, node: cst.FunctionDef) -> None:  # type: ignore[override]
+        self._func_qname_stack.pop()
+
+    def visit_ClassDef(self, node: cst.ClassDef) -> None:  # type: ignore[override]
+        self._qname_prefix = f"{self._qname_prefix}{node.name.value}."
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:  # type: ignore[override]
+        qname = self._qname_prefix + node.name.value
+        self._func_qname_stack.append(qname)
+        self.function_local_imports.setdefault(qname, set())
+
+    def visit_Import(self, node: cst.Import) -> None:  # type: ignore[override]
+        self.other_import_nodes.append(node)
+
+    def visit_ImportFrom(self, node: cst.ImportFrom) -> None:  # type: ignore[override]
+        self.importfrom_nodes.append(node)
+        if node.names is None or isinstance(node.names, cst.ImportStar):
+            return
+        module_name = self._flatten_module_name(node.module)
+        for alias in node.names:
+            if isinstance(alias, cst.ImportAlias):
+                asname = alias.asname.name.value if alias.asname else None
+                name = alias.name.value if isinstance(alias.name, cst.Name) else None
+                if name:
+                    self.name_to_from[name if not asname else asname] = (
+                        module_name,
+                        name,
+                        asname,
+                    )
+                    # An import inside a function counts for every enclosing
+                    # function, matching what a scan of each body would find.
+                    for qname in self._func_qname_stack:
+                        self.function_local_imports[qname].add((module_name, name))
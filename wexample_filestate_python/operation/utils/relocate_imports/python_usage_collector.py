@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar, DefaultDict
+
+import libcst as cst
+
+from wexample_filestate_python.operation.utils.cached_dispatch import (
+    CachedVisitorDispatchMixin,
+)
+
+if TYPE_CHECKING:
+    from wexample_filestate_python.operation.utils.relocate_imports.python_parser_import_index import (
+        PythonParserImportIndex,
+    )
+
+
+class PythonUsageCollector(CachedVisitorDispatchMixin, cst.CSTVisitor):
+    """Collect usage of imported names across three categories:
+    - A: runtime usages inside function/method bodies (class calls, typing.cast target)
+    - B: class-level property type annotations
+    - C: type-only annotations in params/returns/module-level AnnAssign
+
+    The collector mutates the provided buckets so the caller can reuse shared storage.
+    """
+
+    DEFAULT_CAST_FUNCTION_CANDIDATES: ClassVar[set[str]] = {"cast"}
+
+    def __init__(
+        self,
+        imported_value_names: set[str],
+        functions_needing_local: DefaultDict[str, set[str]],
+        used_in_B: set[str],
+        used_in_C_annot: set[str],
+        cast_type_names_anywhere: set[str],
+        cast_function_candidates: set[str] | None = None,
+        future_annotations_enabled: bool = True,
+        idx: PythonParserImportIndex | None = None,
+    ) -> None:
+        super().__init__()
+        self.imported_value_names = imported_value_names
+        self.functions_needing_local = functions_needing_local
+        self.used_in_B = used_in_B
+        self.used_in_C_annot = used_in_C_annot
+        self.cast_type_names_anywhere = cast_type_names_anywhere
+        self.cast_function_candidates = (
+            set(self.DEFAULT_CAST_FUNCTION_CANDIDATES)
+            if cast_function_candidates is None
+            else cast_function_candidates
+        )
+        self.future_annotations_enabled = future_annotations_enabled
+        self.idx = idx
+
+        self.class_stack: list[str] = []
+        # Running dotted prefix of the class stack ("Outer.Inner."), so each
+        # function's qualified name is one concatenation, not a list join.
+        self._qname_prefix: str = ""
+        self.func_stack: list[str] = []
+        self._in_annotation_stack: list[bool] = []
+        self._in_decorator_stack: list[bool] = []
+
+    def leave_Annotation(self, node: cst.Annotation) -> None:  # type: ignore[override]
+        if self._in_annotation_stack:
+            self._in_annotation_stack.pop()
+
+    def leave_AsyncFunctionDef(self, node: cst.AsyncFunctionDef) -> None:  # type: ignore[override]
+        self.func_stack.pop()
+
+    def leave_ClassDef(self, node: cst.ClassDef) -> None:  # type: ignore[override]
+        name = self.class_stack.pop()
+        # The prefix always ends with this class's name plus the dot.
+        self._qname_prefix = self._qname_prefix[: -(len(name) + 1)]
+
+    def leave_Decorator(self, node: cst.Decorator) -> None:  # type: ignore[override]
+        if self._in_decorator_stack:
+            self._in_decorator_stack.pop()
+
+    def leave_FunctionDef(self, node: cst.FunctionDef) -> None:  # type: ignore[override]
+        self.func_stack.pop()
+
+    # ----- B: class-level property annotations -----
+    def visit_AnnAssign(self, node: cst.AnnAssign) -> None:  # type: ignore[override]
+        if not self.class_stack:
+            # module-level annotated assignment -> C
+            self._record_type_names(node.annotation.annotation, self.used_in_C_annot)
+            return
+        # class-level annotated assignment: if future annotations are enabled, treat as type-only (C)
+        # otherwise, require availability at class definition time (B)
+        if self.future_annotations_enabled:
+            self._record_type_names(node.annotation.annotation, self.used_in_C_annot)
+        else:
+            self._record_type_names(node.annotation.annotation, self.used_in_B)
+        # Additionally, if the annotated assignment has a default value at class level,
+        # any imported names referenced in that value are needed at class definition time.
+        try:
+            if node.value is not None:
+                self._walk_expr_for_names(node.value, self.used_in_B)
+        except Exception:
+            pass
+
+    # Track annotation context to avoid misclassifying annotation names as runtime
+    def visit_Annotation(self, node: cst.Annotation) -> bool:  # type: ignore[override]
+        self._in_annotation_stack.append(True)
+        return True
+
+    # Also treat class-level simple assignments where RHS references imported names as B.
+    # Example: SERVICE_CLASS = GithubRemote
+    def visit_Assign(self, node: cst.Assign) -> None:  # type: ignore[override]
+        if not self.class_stack:
+            return
+        # Record any imported names appearing in the value expression as B
+        try:
+            value = node.value
+        except Exception:
+            return
+        self._walk_expr_for_names(value, self.used_in_B)
+
+    def visit_AsyncFunctionDef(self, node: cst.AsyncFunctionDef) -> bool:  # type: ignore[override]
+        self.func_stack.append(self._qualified_func_name(node.name.value))
+        # Record return annotation for C
+        if node.returns is not None:
+            self._record_type_names(node.returns.annotation, self.used_in_C_annot)
+        return True
+
+    # ----- A: runtime usages inside functions -----
+    def visit_Call(self, node: cst.Call) -> None:  # type: ignore[override]
+        if not self.func_stack:
+            return
+        func = node.func
+        if isinstance(func, cst.Name):
+            callee = func.value
+            # class constructor call
+            if callee in self.imported_value_names and callee[:1].isupper():
+                self.functions_needing_local[self.func_stack[-1]].add(callee)
+                return
+            # typing.cast(x, MyClass) when used as bare `cast(...)`
+            if (
+                (callee in self.cast_function_candidates or "cast" in callee.lower())
+                and node.args
+                and len(node.args) >= 1
+            ):
+                type_arg = node.args[0].value
+                # Collect any imported names appearing anywhere inside the type expression
+                names = self._collect_names_from_type_expr(type_arg)
+                for n in names:
+                    # Always record for module-wide exclusion from TYPE_CHECKING
+                    self.cast_type_names_anywhere.add(n)
+                    # Always schedule local import for this function; localizer will filter if module cannot be resolved
+                    if self.func_stack:
+                        self.functions_needing_local[self.func_stack[-1]].add(n)
+                return
+        elif isinstance(func, cst.Attribute):
+            # typing.cast(...) or pkg.cast(...)
+            if (
+                isinstance(func.attr, cst.Name)
+                and (
+                    func.attr.value in self.cast_function_candidates
+                    or "cast" in func.attr.value.lower()
+                )
+                and node.args
+                and len(node.args) >= 1
+            ):
+                type_arg = node.args[0].value
+                names = self._collect_names_from_type_expr(type_arg)
+                for n in names:
+                    self.cast_type_names_anywhere.add(n)
+                    if self.func_stack:
+                        self.functions_needing_local[self.func_stack[-1]].add(n)
+                return
+
+    # ----- Stack management -----
+    def visit_ClassDef(self, node: cst.ClassDef) -> bool:  # type: ignore[override]
+        self.class_stack.append(node.name.value)
+        self._qname_prefix = f"{self._qname_prefix}{node.name.value}."
+        # Treat symbols in the inheritance list as B (must be available at class creation)
+        for base in node.bases:
+            try:
+                self._walk_expr_for_names(base.value, self.used_in_B)
+            except Exception:
+                pass
+        return True
+
+    # Track decorator context to avoid treating decorator names as runtime usage
+    def visit_Decorator(self, node: cst.Decorator) -> bool:  # type: ignore[override]
+        self._in_decorator_stack.append(True)
+        return True
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:  # type: ignore[override]
+        self.func_stack.append(self._qualified_func_name(node.name.value))
+        # Record return annotation for C
+        if node.returns is not None:
+            self._record_type_names(node.returns.annotation, self.used_in_C_annot)
+        return True
+
+    # Treat bare Name usage inside function bodies as runtime usage (A)
+    def visit_Name(self, node: cst.Name) -> None:  # type: ignore[override]
+        if not self.func_stack:
+            return
+        if self._in_annotation_stack or self._in_decorator_stack:
+            return
+        val = node.value
+        # Do not treat 'cast' identifier as runtime usage; keep typing at module level
+        if val == "cast":
+            return
+        if val in self.imported_value_names:
+            # Resolve module to avoid misclassifying annotation-only names like Mapping
+            resolved_mod = None
+            try:
+                if hasattr(self, "idx") and getattr(self, "idx") is not None:  # type: ignore[attr-defined]
+                    resolved_mod = getattr(self, "idx").name_to_from.get(val, (None, None, None))[0]  # type: ignore[index]
+            except Exception:
+                resolved_mod = None
+            # Skip if module is unknown or belongs to typing/collections.abc
+            if resolved_mod in (None, "typing", "collections", "collections.abc"):
+                return
+            self.functions_needing_local[self.func_stack[-1]].add(val)
+
+    # ----- C: function param annotations -----
+    def visit_Param(self, node: cst.Param) -> None:  # type: ignore[override]
+        if node.annotation is not None:
+            self._record_type_names(node.annotation.annotation, self.used_in_C_annot)
+
+    # Scan the Parameters node for defaults; names in defaults are evaluated
+    # at definition time (module init), so they are needed at module level (B).
+    def visit_Parameters(self, node: cst.Parameters) -> bool:  # type: ignore[override]
+        try:
+            # Aggregate all parameter-like collections
+            all_params: list[cst.Param] = []
+            all_params.extend(list(node.params))
+            all_params.extend(list(node.posonly_params))
+            all_params.extend(list(node.kwonly_params))
+            if node.star_arg is not None and isinstance(node.star_arg, cst.Param):
+                all_params.append(node.star_arg)
+            if node.star_kwarg is not None and isinstance(node.star_kwarg, cst.Param):
+                all_params.append(node.star_kwarg)
+
+            for p in all_params:
+                has_default = p.default is not None
+                if not has_default:
+                    continue
+                collected: set[str] = set()
+
+                def _collect_base_names(expr: cst.BaseExpression) -> None:
+                    if isinstance(expr, cst.Name):
+                        collected.add(expr.value)
+                    elif isinstance(expr, cst.Attribute):
+                        _collect_base_names(expr.value)
+                    elif isinstance(expr, cst.Subscript):
+                        _collect_base_names(expr.value)
+                        for e in expr.slice:
+                            if isinstance(e, cst.SubscriptElement) and isinstance(
+                                e.slice, cst.Index
+                            ):
+                                _collect_base_names(e.slice.value)
+
+                _collect_base_names(p.default)  # type: ignore[arg-type]
+                self.used_in_B.update(collected)
+        except Exception:
+            pass
+        return True
+
+    # Collect names inside a type expression (Name, Attribute tail, Subscript args)
+    def _collect_names_from_type_expr(self, expr: cst.BaseExpression) -> set[str]:
+        acc: set[str] = set()
+        # Handle forward-ref style: cast("Foo", x) or cast("dict[str, Foo]", x)
+        if isinstance(expr, cst.SimpleString):
+            try:
+                # Remove surrounding quotes; libcst handles raw string quotes
+                text = expr.evaluated_value
+                parsed = cst.parse_expression(text)
+                self._walk_expr_for_names(parsed, acc)
+                return acc
+            except Exception:
+                return acc
+        self._walk_expr_for_names(expr, acc)
+        return acc
+
+    # ----- internals -----
+    def _qualified_func_name(self, base: str) -> str:
+        return self._qname_prefix + base
+
+    def _record_type_names(self, ann: cst.BaseExpression, bucket: set[str]) -> None:
+        if isinstance(ann, cst.Name):
+            if ann.value in self.imported_value_names:
+                bucket.add(ann.value)
+        elif isinstance(ann, cst.Subscript):
+            self._walk_expr_for_names(ann.value, bucket)
+            for e in ann.slice:
+                if isinstance(e, cst.SubscriptElement) and isinstance(
+                    e.slice, cst.Index
+                ):
+                    self._walk_expr_for_names(e.slice.value, bucket)
+        else:
+            self._walk_expr_for_names(ann, bucket)
+
+    def _walk_expr_for_names(self, expr: cst.BaseExpression, bucket: set[str]) -> None:
+        if isinstance(expr, cst.Name):
+            if expr.value in self.imported_value_names:
+                bucket.add(expr.value)
+        elif isinstance(expr, cst.Attribute):
+            # Walk attribute chain: prefer recording the base name (e.g., TerminalColor in TerminalColor.WHITE)
+            # Recurse into value first
+            self._walk_expr_for_names(expr.value, bucket)
+            # Also consider direct attr name if projects import attributes directly (rare)
+            if (
+                isinstance(expr.attr, cst.Name)
+                and expr.attr.value in self.imported_value_names
+            ):
+                bucket.add(expr.attr.value)
+        elif isinstance(expr, cst.BinaryOperation):
+            # Handle PEP 604 union types: e.g., Path | None
+            # Traverse both sides of the binary operation
+            try:
+                self._walk_expr_for_names(expr.left, bucket)
+            except Exception:
+                pass
+            try:
+                self._walk_expr_for_names(expr.right, bucket)
+            except Exception:
+                pass
+        elif isinstance(expr, cst.Subscript):
+            self._walk_expr_for_names(expr.value, bucket)
+            for e in expr.slice:
+                if isinstance(e, cst.SubscriptElement) and isinstance(
+                    e.slice, cst.Index
+                ):
+                    self._walk_expr_for_names(e.slice.value, bucket)
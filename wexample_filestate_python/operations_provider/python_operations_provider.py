@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_filestate.operations_provider.abstract_operations_provider import (
+    AbstractOperationsProvider,
+)
+
+if TYPE_CHECKING:
+    from wexample_filestate.operation.abstract_operation import AbstractOperation
+
+
+class PythonOperationsProvider(AbstractOperationsProvider):
+    @staticmethod
+    def get_operations() -> list[type[AbstractOperation]]:
+        from wexample_filestate_python.operation.python_fix_blank_lines_operation import (
+            PythonFixBlankLinesOperation,
+        )
+        from wexample_filestate_python.operation.python_order_constants_operation import (
+            PythonOrderConstantsOperation,
+        )
+        from wexample_filestate_python.operation.python_order_iterable_items_operation import (
+            PythonOrderIterableItemsOperation,
+        )
+        from wexample_filestate_python.operation.python_order_module_docstring_operation import (
+            PythonOrderModuleDocstringOperation,
+        )
+        from wexample_filestate_python.operation.python_order_module_functions_operation import (
+            PythonOrderModuleFunctionsOperation,
+        )
+        from wexample_filestate_python.operation.python_relocate_imports_operation import (
+            PythonRelocateImportsOperation,
+        )
+        from wexample_filestate_python.operation.python_remove_unused_imports_operation import (
+            PythonRemoveUnusedOperation,
+        )
+        from wexample_filestate_python.operation.python_sort_imports_operation import (
+            PythonSortImportsOperation,
+        )
+        from wexample_filestate_python.operation.python_unquote_annotations_operation import (
+            PythonUnquoteAnnotationsOperation,
+        )
+
+        return [
+            PythonFixBlankLinesOperation,
+            PythonOrderConstantsOperation,
+            PythonOrderIterableItemsOperation,
+            PythonOrderModuleDocstringOperation,
+            PythonOrderModuleFunctionsOperation,
+            PythonRelocateImportsOperation,
+            PythonRemoveUnusedOperation,
+            PythonSortImportsOperation,
+            PythonUnquoteAnnotationsOperation,
+        ]
@@ -26,10 +26,12 @@ class PythonWorkdir(AppWorkdir):
     def get_operations_providers(self) -> List[Type["AbstractOperationsProvider"]]:
         from wexample_filestate.operations_provider.default_operations_provider import DefaultOperationsProvider
         from wexample_filestate_git.operations_provider.git_operations_provider import GitOperationsProvider
+        from wexample_filestate_python.operations_provider.python_operations_provider import PythonOperationsProvider
 
         return [
             DefaultOperationsProvider,
-            GitOperationsProvider
+            GitOperationsProvider,
+            PythonOperationsProvider
         ]
 
     @staticmethod